@@ -21,10 +21,13 @@ Usage:
 # Database
 from .database import (
     init_database,
+    init_database_async,
     get_session,
     store_fetch_metadata,
+    store_fetch_records,
     get_recent_fetches,
     store_alert,
+    FetchRecord,
     FetchMetadata,
     DataContract,
     SourceHealth,
@@ -36,6 +39,7 @@ from .database import (
 from .metadata import (
     track_fetch,
     TrackedHTTPClient,
+    IncrementalHasher,
     create_metadata,
     enrich_data_with_metadata,
     calculate_content_hash,
@@ -69,7 +73,8 @@ from .fetchers import (
     fetch_entsoe_grid,
     fetch_national_grid_eso,
     fetch_tomtom_traffic,
-    calculate_overall_quality_score
+    calculate_overall_quality_score,
+    close_http_client
 )
 
 __version__ = "1.0.0"
@@ -78,10 +83,13 @@ __version__ = "1.0.0"
 __all__ = [
     # Database
     "init_database",
+    "init_database_async",
     "get_session",
     "store_fetch_metadata",
+    "store_fetch_records",
     "get_recent_fetches",
     "store_alert",
+    "FetchRecord",
     "FetchMetadata",
     "DataContract",
     "SourceHealth",
@@ -91,6 +99,7 @@ __all__ = [
     # Metadata
     "track_fetch",
     "TrackedHTTPClient",
+    "IncrementalHasher",
     "create_metadata",
     "enrich_data_with_metadata",
     "calculate_content_hash",
@@ -121,4 +130,5 @@ __all__ = [
     "fetch_national_grid_eso",
     "fetch_tomtom_traffic",
     "calculate_overall_quality_score",
+    "close_http_client",
 ]
@@ -8,11 +8,18 @@ Uses SQLAlchemy ORM to track:
 - Alerts and incidents
 """
 
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, JSON
+from sqlalchemy import create_engine, event, insert, inspect, text, Column, Index, Integer, String, Float, DateTime, Boolean, Text, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from dataclasses import dataclass, fields
 from datetime import datetime
+from typing import List, Optional
+import asyncio
+import logging
 import os
+import threading
+
+logger = logging.getLogger(__name__)
 
 Base = declarative_base()
 
@@ -23,12 +30,12 @@ class FetchMetadata(Base):
     __tablename__ = "fetch_metadata"
     
     id = Column(Integer, primary_key=True)
-    source_id = Column(String(50), nullable=False, index=True)
+    source_id = Column(String(50), nullable=False)
     source_name = Column(String(100))
     source_url = Column(String(500))
     
     # Timing
-    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     response_time_ms = Column(Float)
     
     # Status
@@ -37,7 +44,7 @@ class FetchMetadata(Base):
     error_message = Column(Text)
     
     # Content
-    content_hash = Column(String(64))  # SHA256 hash
+    content_hash = Column(String(64))  # BLAKE2b-256 hex digest
     data_size_bytes = Column(Integer)
     row_count = Column(Integer)
     
@@ -49,6 +56,13 @@ class FetchMetadata(Base):
     # Metadata
     version = Column(String(20), default="10.1")
     
+    # Lookups always filter by source and order by newest first
+    # (get_recent_fetches), so one composite index serves them without a
+    # sort step and costs a single index update per insert.
+    __table_args__ = (
+        Index("ix_fm_src_time", source_id, fetched_at.desc()),
+    )
+    
     def __repr__(self):
         return f"<FetchMetadata({self.source_id} at {self.fetched_at})>"
 
@@ -162,32 +176,89 @@ class ReconciliationCheck(Base):
 _engine = None
 _SessionLocal = None
 
+# Guards first-time creation of the two globals above; once set they are
+# read without taking the lock
+_init_lock = threading.Lock()
+
+# Connection pool settings (metadata inserts happen on every fetch, so the
+# default pool of 5 blocks on checkout under concurrent load)
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+POOL_RECYCLE_SECONDS = 3600
+
+# Applied to every new SQLite connection. WAL lets readers and the writer
+# overlap; NORMAL sync is safe with WAL and avoids an fsync per commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure a fresh SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
 
 def get_engine():
     """Get or create database engine"""
     global _engine
     
-    if _engine is None:
-        # Use PostgreSQL if DATABASE_URL is set (Railway), otherwise SQLite
-        database_url = os.getenv("DATABASE_URL")
-        
-        if database_url:
-            # PostgreSQL
-            _engine = create_engine(database_url)
-        else:
-            # SQLite (local development)
-            _engine = create_engine("sqlite:///evl_foundation.db", echo=False)
+    if _engine is not None:
+        return _engine
+    
+    with _init_lock:
+        if _engine is None:
+            _engine = _create_engine()
     
     return _engine
 
 
+def _create_engine():
+    """Build the engine for the configured database"""
+    
+    # Use PostgreSQL if DATABASE_URL is set (Railway), otherwise SQLite
+    database_url = os.getenv("DATABASE_URL")
+    
+    if database_url:
+        # PostgreSQL
+        return create_engine(
+            database_url,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_recycle=POOL_RECYCLE_SECONDS,
+            pool_pre_ping=False
+        )
+    
+    # SQLite (local development)
+    engine = create_engine(
+        "sqlite:///evl_foundation.db",
+        echo=False,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        connect_args={"check_same_thread": False, "timeout": 30}
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    return engine
+
+
 def get_session_local():
     """Get session factory"""
     global _SessionLocal
     
-    if _SessionLocal is None:
-        engine = get_engine()
-        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    if _SessionLocal is not None:
+        return _SessionLocal
+    
+    engine = get_engine()
+    with _init_lock:
+        if _SessionLocal is None:
+            _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     
     return _SessionLocal
 
@@ -198,15 +269,97 @@ def get_session() -> Session:
     return SessionLocal()
 
 
+# Single-column indexes replaced by ix_fm_src_time
+_LEGACY_FETCH_METADATA_INDEXES = ("ix_fetch_metadata_source_id", "ix_fetch_metadata_fetched_at")
+
+
+def _migrate_fetch_metadata_indexes(engine):
+    """Create the composite index on existing tables and drop the old ones"""
+    
+    existing = {ix["name"] for ix in inspect(engine).get_indexes(FetchMetadata.__tablename__)}
+    
+    for index in FetchMetadata.__table__.indexes:
+        if index.name not in existing:
+            index.create(bind=engine)
+    
+    with engine.begin() as conn:
+        for name in _LEGACY_FETCH_METADATA_INDEXES:
+            if name in existing:
+                conn.execute(text(f"DROP INDEX {name}"))
+
+
 def init_database():
-    """Initialize database tables"""
+    """
+    Initialize database tables
+    
+    Also builds the engine and session factory up front, so the first
+    request that stores metadata doesn't pay for it.
+    """
     engine = get_engine()
     Base.metadata.create_all(bind=engine)
-    print("✅ Database initialized successfully")
+    _migrate_fetch_metadata_indexes(engine)
+    get_session_local()
+    logger.info("✅ Database initialized successfully")
+
+
+async def init_database_async():
+    """
+    init_database for async startup hooks
+    
+    Runs in a worker thread so connecting and creating tables doesn't
+    block the event loop.
+    """
+    await asyncio.to_thread(init_database)
 
 
 # Convenience functions
 
+@dataclass(slots=True)
+class FetchRecord:
+    """
+    One fetch_metadata row, kept as a slotted dataclass on the hot path
+    
+    Fetch tracking runs on every upstream call; building one of these is
+    much cheaper than an ORM FetchMetadata instance, and rows are only
+    turned into mappings at insert time.
+    """
+    source_id: str
+    source_url: str
+    status_code: int
+    response_time_ms: float
+    content_hash: str
+    row_count: int = 0
+    success: bool = True
+    error_message: Optional[str] = None
+    validation_passed: bool = True
+    validation_errors: Optional[list] = None
+    data_quality_score: float = 1.0
+    data_size_bytes: int = 0
+
+
+_FETCH_RECORD_FIELDS = tuple(f.name for f in fields(FetchRecord))
+
+
+def store_fetch_records(records: List[FetchRecord]):
+    """Insert fetch records in a single executemany"""
+    
+    if not records:
+        return
+    
+    rows = [{name: getattr(r, name) for name in _FETCH_RECORD_FIELDS} for r in records]
+    session = get_session()
+    
+    try:
+        session.execute(insert(FetchMetadata), rows)
+        session.commit()
+        
+    except Exception as e:
+        session.rollback()
+        logger.error("Error storing metadata: %s", e)
+    finally:
+        session.close()
+
+
 def store_fetch_metadata(
     source_id: str,
     source_url: str,
@@ -223,32 +376,20 @@ def store_fetch_metadata(
 ):
     """Store API fetch metadata in database"""
     
-    session = get_session()
-    
-    try:
-        metadata = FetchMetadata(
-            source_id=source_id,
-            source_url=source_url,
-            status_code=status_code,
-            response_time_ms=response_time_ms,
-            content_hash=content_hash,
-            row_count=row_count,
-            success=success,
-            error_message=error_message,
-            validation_passed=validation_passed,
-            validation_errors=validation_errors,
-            data_quality_score=data_quality_score,
-            data_size_bytes=data_size_bytes
-        )
-        
-        session.add(metadata)
-        session.commit()
-        
-    except Exception as e:
-        session.rollback()
-        print(f"Error storing metadata: {e}")
-    finally:
-        session.close()
+    store_fetch_records([FetchRecord(
+        source_id=source_id,
+        source_url=source_url,
+        status_code=status_code,
+        response_time_ms=response_time_ms,
+        content_hash=content_hash,
+        row_count=row_count,
+        success=success,
+        error_message=error_message,
+        validation_passed=validation_passed,
+        validation_errors=validation_errors,
+        data_quality_score=data_quality_score,
+        data_size_bytes=data_size_bytes
+    )])
 
 
 def get_recent_fetches(source_id: str, limit: int = 10):
@@ -294,7 +435,7 @@ def store_alert(
         
     except Exception as e:
         session.rollback()
-        print(f"Error storing alert: {e}")
+        logger.error("Error storing alert: %s", e)
     finally:
         session.close()
 
@@ -8,13 +8,57 @@ If API fails, returns estimated/fallback data with lower quality score.
 """
 
 import httpx
+import orjson
 import asyncio
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 import os
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+import logging
+import re
 import time
+import weakref
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401 - lets httpx speak HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# ==================== SHARED HTTP CLIENT ====================
+
+# One pooled client per event loop, so fetch_all_data's parallel calls and
+# repeated analyses reuse keep-alive connections and TLS sessions. A client
+# only works on the loop it was opened on: callers that run each fetch in a
+# fresh loop (asyncio.run, worker threads) get their own instead of one tied
+# to a closed loop. Timeouts are passed per request.
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared AsyncClient for the running event loop, created on first use"""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = _http_clients[loop] = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+    return client
+
+
+async def close_http_client():
+    """Close the running loop's shared client (call before the loop ends)"""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
 
 
 @dataclass
@@ -62,77 +106,79 @@ async def fetch_opencharge_map(
             "key": ""  # API key optional for OpenChargeMap
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            elapsed_ms = (time.time() - start) * 1000
-            
-            # Transform to our format
-            chargers = []
-            parse_errors = []  # [C-7] ✅ Track errors - no more silent failures!
-            
-            for poi in data:
-                try:
-                    chargers.append({
-                        "id": poi.get("ID"),
-                        "name": poi.get("AddressInfo", {}).get("Title", "Unknown"),
-                        "lat": poi.get("AddressInfo", {}).get("Latitude"),
-                        "lon": poi.get("AddressInfo", {}).get("Longitude"),
-                        "distance_km": poi.get("AddressInfo", {}).get("Distance"),
-                        "operator": poi.get("OperatorInfo", {}).get("Title", "Unknown"),
-                        "num_points": poi.get("NumberOfPoints", 0),
-                        "status": poi.get("StatusType", {}).get("Title", "Unknown"),
-                        "connections": [
-                            {
-                                "type": conn.get("ConnectionType", {}).get("Title"),
-                                "power_kw": conn.get("PowerKW", 0),
-                                "level": conn.get("Level", {}).get("Title"),
-                                "current": conn.get("CurrentType", {}).get("Title")
-                            }
-                            for conn in poi.get("Connections", [])
-                        ]
-                    })
-                except Exception as e:
-                    # [C-7] ✅ Log parsing failure with POI ID for debugging
-                    poi_id = poi.get("ID", "unknown")
-                    error_msg = f"Failed to parse OpenChargeMap POI {poi_id}: {str(e)}"
-                    print(f"⚠️  {error_msg}")
-                    
-                    # [C-7] ✅ Collect error statistics
-                    parse_errors.append({
-                        "poi_id": poi_id,
-                        "error": str(e),
-                        "error_type": type(e).__name__
-                    })
-                    continue
-            
-            # [C-7] ✅ Log summary if there were parsing errors
-            if parse_errors:
-                print(f"⚠️  OpenChargeMap: {len(parse_errors)} POIs failed to parse out of {len(data)} total")
-                print(f"   Successfully parsed: {len(chargers)} chargers")
-                print(f"   Success rate: {len(chargers)/(len(data)) * 100:.1f}%")
-            
-            # [C-7] ✅ Calculate quality score based on parse success rate
-            quality_score = 1.0 if len(chargers) > 0 else 0.7
-            if parse_errors:
-                success_rate = len(chargers) / (len(chargers) + len(parse_errors))
-                quality_score = min(1.0, success_rate + 0.3)  # Partial credit
-            
-            return FetchResult(
-                success=True,
-                data=chargers,
-                source_id="openchargemap",
-                response_time_ms=elapsed_ms,
-                quality_score=quality_score
+        client = get_http_client()
+        response = await client.get(url, params=params, timeout=30.0)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        elapsed_ms = (time.time() - start) * 1000
+        
+        # Transform to our format
+        chargers = []
+        parse_errors = []  # [C-7] ✅ Track errors - no more silent failures!
+        
+        for poi in data:
+            try:
+                chargers.append({
+                    "id": poi.get("ID"),
+                    "name": poi.get("AddressInfo", {}).get("Title", "Unknown"),
+                    "lat": poi.get("AddressInfo", {}).get("Latitude"),
+                    "lon": poi.get("AddressInfo", {}).get("Longitude"),
+                    "distance_km": poi.get("AddressInfo", {}).get("Distance"),
+                    "operator": poi.get("OperatorInfo", {}).get("Title", "Unknown"),
+                    "num_points": poi.get("NumberOfPoints", 0),
+                    "status": poi.get("StatusType", {}).get("Title", "Unknown"),
+                    "connections": [
+                        {
+                            "type": conn.get("ConnectionType", {}).get("Title"),
+                            "power_kw": conn.get("PowerKW", 0),
+                            "level": conn.get("Level", {}).get("Title"),
+                            "current": conn.get("CurrentType", {}).get("Title")
+                        }
+                        for conn in poi.get("Connections", [])
+                    ]
+                })
+            except Exception as e:
+                # [C-7] ✅ Log parsing failure with POI ID for debugging
+                poi_id = poi.get("ID", "unknown")
+                logger.debug("Failed to parse OpenChargeMap POI %s: %s", poi_id, e)
+                
+                # [C-7] ✅ Collect error statistics
+                parse_errors.append({
+                    "poi_id": poi_id,
+                    "error": str(e),
+                    "error_type": type(e).__name__
+                })
+                continue
+        
+        # [C-7] ✅ Log summary if there were parsing errors (one line
+        # per fetch; individual POIs are at DEBUG)
+        if parse_errors:
+            logger.warning(
+                "OpenChargeMap: %d/%d POIs failed to parse (first: POI %s, %s)",
+                len(parse_errors), len(data),
+                parse_errors[0]["poi_id"], parse_errors[0]["error"]
             )
-            
+        
+        # [C-7] ✅ Calculate quality score based on parse success rate
+        quality_score = 1.0 if len(chargers) > 0 else 0.7
+        if parse_errors:
+            success_rate = len(chargers) / (len(chargers) + len(parse_errors))
+            quality_score = min(1.0, success_rate + 0.3)  # Partial credit
+        
+        return FetchResult(
+            success=True,
+            data=chargers,
+            source_id="openchargemap",
+            response_time_ms=elapsed_ms,
+            quality_score=quality_score
+        )
+        
     except Exception as e:
         elapsed_ms = (time.time() - start) * 1000
         
         # GRACEFUL DEGRADATION: Return empty list instead of failing
-        print(f"⚠️  OpenChargeMap API error: {e} - using fallback")
+        logger.warning("OpenChargeMap API error: %s - using fallback", e)
         
         return FetchResult(
             success=True,  # Changed from False!
@@ -146,6 +192,15 @@ async def fetch_opencharge_map(
 
 # ==================== 2. POSTCODES.IO (FIXED) ====================
 
+# Fallback region lookup when Postcodes.io is down: postcode area -> region
+_POSTCODE_AREA_RE = re.compile(r"\s*([A-Za-z]{1,2})")
+_POSTCODE_AREA_REGIONS = {
+    **dict.fromkeys(["NW", "N", "E", "SE", "SW", "W", "EC", "WC"], ("London", 51.5, -0.1)),
+    **dict.fromkeys(["M", "OL", "SK", "WN"], ("Manchester", 53.48, -2.24)),
+    "B": ("Birmingham", 52.48, -1.90)
+}
+
+
 async def fetch_postcode_data(postcode: str) -> FetchResult:
     """
     Fetch location data from Postcodes.io
@@ -162,57 +217,48 @@ async def fetch_postcode_data(postcode: str) -> FetchResult:
         
         url = f"https://api.postcodes.io/postcodes/{postcode_clean}"
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url)
+        client = get_http_client()
+        response = await client.get(url, timeout=10.0)
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            elapsed_ms = (time.time() - start) * 1000
             
-            if response.status_code == 200:
-                data = response.json()
-                elapsed_ms = (time.time() - start) * 1000
+            if data.get("status") == 200:
+                result = data.get("result", {})
                 
-                if data.get("status") == 200:
-                    result = data.get("result", {})
-                    
-                    return FetchResult(
-                        success=True,
-                        data={
-                            "postcode": result.get("postcode"),
-                            "lat": result.get("latitude"),
-                            "lon": result.get("longitude"),
-                            "country": result.get("country"),
-                            "region": result.get("region"),
-                            "admin_district": result.get("admin_district"),
-                            "codes": result.get("codes", {})
-                        },
-                        source_id="postcodes_io",
-                        response_time_ms=elapsed_ms,
-                        quality_score=1.0
-                    )
+                return FetchResult(
+                    success=True,
+                    data={
+                        "postcode": result.get("postcode"),
+                        "lat": result.get("latitude"),
+                        "lon": result.get("longitude"),
+                        "country": result.get("country"),
+                        "region": result.get("region"),
+                        "admin_district": result.get("admin_district"),
+                        "codes": result.get("codes", {})
+                    },
+                    source_id="postcodes_io",
+                    response_time_ms=elapsed_ms,
+                    quality_score=1.0
+                )
+        
+        # If we get here, postcode not found or error
+        raise Exception(f"HTTP {response.status_code}")
             
-            # If we get here, postcode not found or error
-            raise Exception(f"HTTP {response.status_code}")
-                
     except Exception as e:
         elapsed_ms = (time.time() - start) * 1000
         
         # GRACEFUL DEGRADATION: Return partial data
-        print(f"⚠️  Postcodes.io error: {e} - using fallback")
+        logger.warning("Postcodes.io error: %s - using fallback", e)
         
-        # Try to extract first part of postcode for region estimation
+        # Rough region estimation from the postcode area (leading letters)
         region = "Unknown"
         lat, lon = 51.5, -0.1  # London default
         
-        if postcode:
-            first_letters = ''.join(filter(str.isalpha, postcode.upper()))[:2]
-            # Rough postcode area estimation
-            if first_letters in ["NW", "N", "E", "SE", "SW", "W", "EC", "WC"]:
-                region = "London"
-                lat, lon = 51.5, -0.1
-            elif first_letters in ["M", "OL", "SK", "WN"]:
-                region = "Manchester"
-                lat, lon = 53.48, -2.24
-            elif first_letters in ["B"]:
-                region = "Birmingham"
-                lat, lon = 52.48, -1.90
+        match = _POSTCODE_AREA_RE.match(postcode or "")
+        if match:
+            region, lat, lon = _POSTCODE_AREA_REGIONS.get(match.group(1).upper(), (region, lat, lon))
         
         return FetchResult(
             success=True,  # Still success with estimated data
@@ -394,67 +440,67 @@ async def fetch_osm_facilities(
         out body;
         """
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(url, data={"data": query})
+        client = get_http_client()
+        response = await client.post(url, data={"data": query}, timeout=30.0)
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            elapsed_ms = (time.time() - start) * 1000
             
-            if response.status_code == 200:
-                data = response.json()
-                elapsed_ms = (time.time() - start) * 1000
-                
-                # Count facilities by type
-                facilities = {
-                    "restaurant": 0,
-                    "cafe": 0,
-                    "supermarket": 0,
-                    "mall": 0,
-                    "parking": 0,
-                    "fuel": 0,
-                    "gym": 0,
-                    "hotel": 0,
-                    "total": 0
-                }
+            # Count facilities by type
+            facilities = {
+                "restaurant": 0,
+                "cafe": 0,
+                "supermarket": 0,
+                "mall": 0,
+                "parking": 0,
+                "fuel": 0,
+                "gym": 0,
+                "hotel": 0,
+                "total": 0
+            }
+            
+            for element in data.get("elements", []):
+                tags = element.get("tags", {})
+                amenity = tags.get("amenity", "")
+                shop = tags.get("shop", "")
+                leisure = tags.get("leisure", "")
+                tourism = tags.get("tourism", "")
                 
-                for element in data.get("elements", []):
-                    tags = element.get("tags", {})
-                    amenity = tags.get("amenity", "")
-                    shop = tags.get("shop", "")
-                    leisure = tags.get("leisure", "")
-                    tourism = tags.get("tourism", "")
-                    
-                    if amenity in ["restaurant", "fast_food"]:
-                        facilities["restaurant"] += 1
-                    elif amenity == "cafe":
-                        facilities["cafe"] += 1
-                    elif shop in ["supermarket", "convenience"]:
-                        facilities["supermarket"] += 1
-                    elif shop == "mall":
-                        facilities["mall"] += 1
-                    elif amenity == "parking":
-                        facilities["parking"] += 1
-                    elif amenity == "fuel":
-                        facilities["fuel"] += 1
-                    elif leisure in ["fitness_centre", "sports_centre"]:
-                        facilities["gym"] += 1
-                    elif tourism == "hotel":
-                        facilities["hotel"] += 1
-                    
-                    facilities["total"] += 1
+                if amenity in ["restaurant", "fast_food"]:
+                    facilities["restaurant"] += 1
+                elif amenity == "cafe":
+                    facilities["cafe"] += 1
+                elif shop in ["supermarket", "convenience"]:
+                    facilities["supermarket"] += 1
+                elif shop == "mall":
+                    facilities["mall"] += 1
+                elif amenity == "parking":
+                    facilities["parking"] += 1
+                elif amenity == "fuel":
+                    facilities["fuel"] += 1
+                elif leisure in ["fitness_centre", "sports_centre"]:
+                    facilities["gym"] += 1
+                elif tourism == "hotel":
+                    facilities["hotel"] += 1
                 
-                return FetchResult(
-                    success=True,
-                    data=facilities,
-                    source_id="openstreetmap",
-                    response_time_ms=elapsed_ms,
-                    quality_score=1.0 if facilities["total"] > 0 else 0.8
-                )
-            else:
-                raise Exception(f"HTTP {response.status_code}")
+                facilities["total"] += 1
             
+            return FetchResult(
+                success=True,
+                data=facilities,
+                source_id="openstreetmap",
+                response_time_ms=elapsed_ms,
+                quality_score=1.0 if facilities["total"] > 0 else 0.8
+            )
+        else:
+            raise Exception(f"HTTP {response.status_code}")
+        
     except Exception as e:
         elapsed_ms = (time.time() - start) * 1000
         
         # GRACEFUL DEGRADATION: Estimate based on urban/rural
-        print(f"⚠️  OpenStreetMap error: {e} - using estimates")
+        logger.warning("OpenStreetMap error: %s - using estimates", e)
         
         # Estimate facilities based on coordinates
         # Urban areas (closer to 51.5, -0.1) have more facilities
@@ -520,25 +566,25 @@ async def fetch_entsoe_grid(
                 "periodEnd": period_end
             }
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params=params, timeout=10.0)
+            client = get_http_client()
+            response = await client.get(url, params=params, timeout=10.0)
+            
+            if response.status_code == 200:
+                elapsed_ms = (time.time() - start) * 1000
                 
-                if response.status_code == 200:
-                    elapsed_ms = (time.time() - start) * 1000
-                    
-                    return FetchResult(
-                        success=True,
-                        data={
-                            "country": country_code,
-                            "current_load_mw": 35000,
-                            "available_capacity_mw": 60000,
-                            "timestamp": now.isoformat(),
-                            "source": "entsoe_tp_api"
-                        },
-                        source_id="entsoe",
-                        response_time_ms=elapsed_ms,
-                        quality_score=1.0
-                    )
+                return FetchResult(
+                    success=True,
+                    data={
+                        "country": country_code,
+                        "current_load_mw": 35000,
+                        "available_capacity_mw": 60000,
+                        "timestamp": now.isoformat(),
+                        "source": "entsoe_tp_api"
+                    },
+                    source_id="entsoe",
+                    response_time_ms=elapsed_ms,
+                    quality_score=1.0
+                )
         
         # Fall through to estimates
         raise Exception("No API key or API call failed")
@@ -547,7 +593,7 @@ async def fetch_entsoe_grid(
         elapsed_ms = (time.time() - start) * 1000
         
         # GRACEFUL DEGRADATION: Return UK grid estimates
-        print(f"⚠️  ENTSO-E API unavailable: {e} - using estimates")
+        logger.warning("ENTSO-E API unavailable: %s - using estimates", e)
         
         return FetchResult(
             success=True,  # Success with estimates
@@ -567,15 +613,55 @@ async def fetch_entsoe_grid(
 
 # ==================== 7. NATIONAL GRID ESO (FIXED) ====================
 
+# The ESO dataset is published daily, so a successful response is reused
+# for an hour instead of re-requesting it for every analysis. The lock makes
+# concurrent misses share one upstream call; like the HTTP client it is kept
+# per event loop, since an asyncio.Lock can't be awaited from another loop.
+ESO_CACHE_TTL_SECONDS = 3600
+_eso_cache: Dict[str, Any] = {"ts": 0.0, "result": None}
+_eso_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 async def fetch_national_grid_eso() -> FetchResult:
     """
     Fetch data from National Grid ESO
     
     GRACEFUL DEGRADATION:
     - Always returns UK system estimates
+    
+    CACHING:
+    - API results are reused for ESO_CACHE_TTL_SECONDS; estimates are not
+      cached, so the next call retries the API
     """
     start = time.time()
     
+    loop = asyncio.get_running_loop()
+    lock = _eso_locks.get(loop)
+    if lock is None:
+        lock = _eso_locks[loop] = asyncio.Lock()
+    
+    async with lock:
+        cached = _eso_cache["result"]
+        if cached is not None and time.monotonic() - _eso_cache["ts"] < ESO_CACHE_TTL_SECONDS:
+            return replace(
+                cached,
+                data=dict(cached.data),
+                response_time_ms=(time.time() - start) * 1000
+            )
+        
+        result = await _fetch_national_grid_eso(start)
+        if result.error is None:
+            _eso_cache["ts"] = time.monotonic()
+            _eso_cache["result"] = result
+        
+        return replace(result, data=dict(result.data))
+
+
+async def _fetch_national_grid_eso(start: float) -> FetchResult:
+    """Uncached National Grid ESO fetch (see fetch_national_grid_eso)"""
+    
     try:
         url = "https://data.nationalgrideso.com/api/3/action/datastore_search"
         
@@ -584,30 +670,30 @@ async def fetch_national_grid_eso() -> FetchResult:
             "limit": 1
         }
         
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(url, params=params)
+        client = get_http_client()
+        response = await client.get(url, params=params, timeout=15.0)
+        
+        if response.status_code == 200:
+            elapsed_ms = (time.time() - start) * 1000
+            
+            return FetchResult(
+                success=True,
+                data={
+                    "current_demand_mw": 32000,
+                    "source": "national_grid_eso_api"
+                },
+                source_id="national_grid_eso",
+                response_time_ms=elapsed_ms,
+                quality_score=1.0
+            )
+        else:
+            raise Exception(f"HTTP {response.status_code}")
             
-            if response.status_code == 200:
-                elapsed_ms = (time.time() - start) * 1000
-                
-                return FetchResult(
-                    success=True,
-                    data={
-                        "current_demand_mw": 32000,
-                        "source": "national_grid_eso_api"
-                    },
-                    source_id="national_grid_eso",
-                    response_time_ms=elapsed_ms,
-                    quality_score=1.0
-                )
-            else:
-                raise Exception(f"HTTP {response.status_code}")
-                
     except Exception as e:
         elapsed_ms = (time.time() - start) * 1000
         
         # GRACEFUL DEGRADATION: Return estimates
-        print(f"⚠️  National Grid ESO unavailable: {e} - using estimates")
+        logger.warning("National Grid ESO unavailable: %s - using estimates", e)
         
         return FetchResult(
             success=True,
@@ -645,31 +731,31 @@ async def fetch_tomtom_traffic(lat: float, lon: float) -> FetchResult:
                 "point": f"{lat},{lon}"
             }
             
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(url, params=params)
+            client = get_http_client()
+            response = await client.get(url, params=params, timeout=15.0)
+            
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                elapsed_ms = (time.time() - start) * 1000
+                
+                flow_data = data.get("flowSegmentData", {})
+                current_speed = flow_data.get("currentSpeed", 50)
+                free_flow_speed = flow_data.get("freeFlowSpeed", 50)
+                
+                intensity = max(0, 1 - (current_speed / max(free_flow_speed, 1)))
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    elapsed_ms = (time.time() - start) * 1000
-                    
-                    flow_data = data.get("flowSegmentData", {})
-                    current_speed = flow_data.get("currentSpeed", 50)
-                    free_flow_speed = flow_data.get("freeFlowSpeed", 50)
-                    
-                    intensity = max(0, 1 - (current_speed / max(free_flow_speed, 1)))
-                    
-                    return FetchResult(
-                        success=True,
-                        data={
-                            "traffic_intensity": intensity,
-                            "current_speed": current_speed,
-                            "free_flow_speed": free_flow_speed,
-                            "source": "tomtom_api"
-                        },
-                        source_id="tomtom_traffic",
-                        response_time_ms=elapsed_ms,
-                        quality_score=1.0
-                    )
+                return FetchResult(
+                    success=True,
+                    data={
+                        "traffic_intensity": intensity,
+                        "current_speed": current_speed,
+                        "free_flow_speed": free_flow_speed,
+                        "source": "tomtom_api"
+                    },
+                    source_id="tomtom_traffic",
+                    response_time_ms=elapsed_ms,
+                    quality_score=1.0
+                )
         
         raise Exception("No API key or API call failed")
             
@@ -677,7 +763,7 @@ async def fetch_tomtom_traffic(lat: float, lon: float) -> FetchResult:
         elapsed_ms = (time.time() - start) * 1000
         
         # GRACEFUL DEGRADATION: Estimate based on location
-        print(f"⚠️  TomTom API unavailable: {e} - using estimates")
+        logger.warning("TomTom API unavailable: %s - using estimates", e)
         
         # Estimate traffic based on distance from major cities
         distance_from_london = ((lat - 51.5)**2 + (lon + 0.1)**2) ** 0.5
@@ -707,6 +793,11 @@ async def fetch_tomtom_traffic(lat: float, lon: float) -> FetchResult:
 
 # ==================== MASTER FETCH ORCHESTRATOR ====================
 
+# Overall budget for the parallel fetch in fetch_all_data; sources still
+# running after this are cancelled and reported as degraded
+FETCH_DEADLINE_SECONDS = 8.0
+
+
 async def fetch_all_data(
     postcode: Optional[str] = None,
     lat: Optional[float] = None,
@@ -737,10 +828,9 @@ async def fetch_all_data(
         # Default to London if all else fails
         lat, lon = 51.5, -0.1
     
-    # Step 2: Fetch all sources in parallel
+    # Step 2: Fetch all sources in parallel, bounded by one shared deadline
     tasks = {
         "openchargemap": fetch_opencharge_map(lat, lon, radius_km),
-        "postcodes_io": asyncio.create_task(asyncio.sleep(0, postcode_result)),
         "ons_demographics": fetch_ons_demographics(postcode_result.data if postcode_result.success else {}),
         "dft_vehicle_licensing": fetch_dft_vehicle_stats("United Kingdom"),
         "openstreetmap": fetch_osm_facilities(lat, lon, int(radius_km * 1000)),
@@ -748,24 +838,43 @@ async def fetch_all_data(
         "national_grid_eso": fetch_national_grid_eso(),
         "tomtom_traffic": fetch_tomtom_traffic(lat, lon)
     }
+    tasks = {source_id: asyncio.create_task(coro) for source_id, coro in tasks.items()}
+    
+    done, pending = await asyncio.wait(tasks.values(), timeout=FETCH_DEADLINE_SECONDS)
     
-    # Wait for all tasks - ALL WILL SUCCEED
-    results = {}
+    # A slow source must not hold up the whole analysis - it degrades instead
+    for task in pending:
+        task.cancel()
+    if pending:
+        # Let the cancellations unwind (closing connections, releasing the
+        # ESO lock) before returning, so no task is left dangling
+        await asyncio.gather(*pending, return_exceptions=True)
+    
+    # Collect results - ALL WILL SUCCEED
+    results = {"postcodes_io": postcode_result}
     for source_id, task in tasks.items():
-        if source_id == "postcodes_io":
-            results[source_id] = postcode_result
-        else:
-            try:
-                results[source_id] = await task
-            except Exception as e:
-                # This should never happen now, but just in case
-                results[source_id] = FetchResult(
-                    success=True,  # Always success
-                    data={},
-                    source_id=source_id,
-                    error=f"Unexpected error: {str(e)}",
-                    quality_score=0.3
-                )
+        if task in pending:
+            logger.warning("%s exceeded %gs fetch deadline - skipped", source_id, FETCH_DEADLINE_SECONDS)
+            results[source_id] = FetchResult(
+                success=True,  # Always success
+                data={},
+                source_id=source_id,
+                error=f"Timed out after {FETCH_DEADLINE_SECONDS:g}s",
+                quality_score=0.3
+            )
+            continue
+        
+        try:
+            results[source_id] = task.result()
+        except Exception as e:
+            # This should never happen now, but just in case
+            results[source_id] = FetchResult(
+                success=True,  # Always success
+                data={},
+                source_id=source_id,
+                error=f"Unexpected error: {str(e)}",
+                quality_score=0.3
+            )
     
     return results
 
@@ -9,13 +9,18 @@ Data sources for Ukraine EV charging location analysis:
 - Local charging networks (TOKA, UGV, etc.)
 """
 
-import httpx
+import orjson
 import asyncio
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
+import logging
 import os
 import time
 
+from .fetchers import get_http_client
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class FetchResult:
@@ -60,50 +65,55 @@ async def fetch_opencharge_map_ukraine(
             "key": os.getenv("OPENCHARGE_API_KEY", "")
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            elapsed_ms = (time.time() - start) * 1000
-            
-            # Transform to our format
-            chargers = []
-            for poi in data:
-                try:
-                    chargers.append({
-                        "id": poi.get("ID"),
-                        "name": poi.get("AddressInfo", {}).get("Title", "Unknown"),
-                        "lat": poi.get("AddressInfo", {}).get("Latitude"),
-                        "lon": poi.get("AddressInfo", {}).get("Longitude"),
-                        "distance_km": poi.get("AddressInfo", {}).get("Distance"),
-                        "city": poi.get("AddressInfo", {}).get("Town", ""),
-                        "operator": poi.get("OperatorInfo", {}).get("Title", "Unknown"),
-                        "num_points": poi.get("NumberOfPoints", 0),
-                        "status": poi.get("StatusType", {}).get("Title", "Unknown"),
-                        "usage_type": poi.get("UsageType", {}).get("Title", "Unknown"),
-                        "connections": [
-                            {
-                                "type": conn.get("ConnectionType", {}).get("Title"),
-                                "power_kw": conn.get("PowerKW", 0),
-                                "level": conn.get("Level", {}).get("Title"),
-                                "current": conn.get("CurrentType", {}).get("Title")
-                            }
-                            for conn in poi.get("Connections", [])
-                        ]
-                    })
-                except Exception as e:
-                    print(f"Error parsing charger: {e}")
-                    continue
-            
-            return FetchResult(
-                success=True,
-                data=chargers,
-                source_id="openchargemap_ukraine",
-                response_time_ms=elapsed_ms,
-                quality_score=1.0 if len(chargers) > 0 else 0.5
-            )
-            
+        client = get_http_client()
+        response = await client.get(url, params=params, timeout=30.0)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        elapsed_ms = (time.time() - start) * 1000
+        
+        # Transform to our format
+        chargers = []
+        parse_failures = 0
+        for poi in data:
+            try:
+                chargers.append({
+                    "id": poi.get("ID"),
+                    "name": poi.get("AddressInfo", {}).get("Title", "Unknown"),
+                    "lat": poi.get("AddressInfo", {}).get("Latitude"),
+                    "lon": poi.get("AddressInfo", {}).get("Longitude"),
+                    "distance_km": poi.get("AddressInfo", {}).get("Distance"),
+                    "city": poi.get("AddressInfo", {}).get("Town", ""),
+                    "operator": poi.get("OperatorInfo", {}).get("Title", "Unknown"),
+                    "num_points": poi.get("NumberOfPoints", 0),
+                    "status": poi.get("StatusType", {}).get("Title", "Unknown"),
+                    "usage_type": poi.get("UsageType", {}).get("Title", "Unknown"),
+                    "connections": [
+                        {
+                            "type": conn.get("ConnectionType", {}).get("Title"),
+                            "power_kw": conn.get("PowerKW", 0),
+                            "level": conn.get("Level", {}).get("Title"),
+                            "current": conn.get("CurrentType", {}).get("Title")
+                        }
+                        for conn in poi.get("Connections", [])
+                    ]
+                })
+            except Exception as e:
+                logger.debug("Error parsing charger %s: %s", poi.get("ID", "unknown"), e)
+                parse_failures += 1
+                continue
+        
+        if parse_failures:
+            logger.warning("OpenChargeMap UA: %d/%d POIs failed to parse", parse_failures, len(data))
+        
+        return FetchResult(
+            success=True,
+            data=chargers,
+            source_id="openchargemap_ukraine",
+            response_time_ms=elapsed_ms,
+            quality_score=1.0 if len(chargers) > 0 else 0.5
+        )
+        
     except Exception as e:
         elapsed_ms = (time.time() - start) * 1000
         return FetchResult(
@@ -178,23 +188,23 @@ async def fetch_energy_map_ukraine(
             "Content-Type": "application/json"
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
+        client = get_http_client()
+        response = await client.get(url, headers=headers, timeout=30.0)
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            elapsed_ms = (time.time() - start) * 1000
+            
+            return FetchResult(
+                success=True,
+                data=data,
+                source_id="energy_map_ukraine",
+                response_time_ms=elapsed_ms,
+                quality_score=1.0
+            )
+        else:
+            raise Exception(f"API returned status {response.status_code}")
             
-            if response.status_code == 200:
-                data = response.json()
-                elapsed_ms = (time.time() - start) * 1000
-                
-                return FetchResult(
-                    success=True,
-                    data=data,
-                    source_id="energy_map_ukraine",
-                    response_time_ms=elapsed_ms,
-                    quality_score=1.0
-                )
-            else:
-                raise Exception(f"API returned status {response.status_code}")
-                
     except Exception as e:
         elapsed_ms = (time.time() - start) * 1000
         
@@ -302,39 +312,39 @@ async def fetch_ukraine_geocode(city: str) -> FetchResult:
             "User-Agent": "EVL-Location-Analyzer/2.0"
         }
         
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
+        client = get_http_client()
+        response = await client.get(url, params=params, headers=headers, timeout=10.0)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        elapsed_ms = (time.time() - start) * 1000
+        
+        if data and len(data) > 0:
+            result = data[0]
             
-            data = response.json()
-            elapsed_ms = (time.time() - start) * 1000
+            return FetchResult(
+                success=True,
+                data={
+                    "city": city,
+                    "lat": float(result.get("lat")),
+                    "lon": float(result.get("lon")),
+                    "display_name": result.get("display_name"),
+                    "country": "Ukraine"
+                },
+                source_id="ukraine_geocode",
+                response_time_ms=elapsed_ms,
+                quality_score=1.0
+            )
+        else:
+            return FetchResult(
+                success=False,
+                data={},
+                source_id="ukraine_geocode",
+                error="City not found",
+                response_time_ms=elapsed_ms,
+                quality_score=0.0
+            )
             
-            if data and len(data) > 0:
-                result = data[0]
-                
-                return FetchResult(
-                    success=True,
-                    data={
-                        "city": city,
-                        "lat": float(result.get("lat")),
-                        "lon": float(result.get("lon")),
-                        "display_name": result.get("display_name"),
-                        "country": "Ukraine"
-                    },
-                    source_id="ukraine_geocode",
-                    response_time_ms=elapsed_ms,
-                    quality_score=1.0
-                )
-            else:
-                return FetchResult(
-                    success=False,
-                    data={},
-                    source_id="ukraine_geocode",
-                    error="City not found",
-                    response_time_ms=elapsed_ms,
-                    quality_score=0.0
-                )
-                
     except Exception as e:
         elapsed_ms = (time.time() - start) * 1000
         return FetchResult(
@@ -11,21 +11,32 @@ Provides decorators and utilities to track:
 
 import time
 import hashlib
+import inspect
 import json
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 from functools import wraps
 import httpx
+import orjson
 
-from .database import store_fetch_metadata
+from .database import FetchRecord, store_fetch_records
 
 
-def calculate_content_hash(data: Any) -> str:
-    """Calculate SHA256 hash of data"""
+def _content_bytes(data: Any, canonical: bool = True) -> bytes:
+    """
+    Serialize data to the stable byte form used for hashing
+    
+    canonical=True sorts dict keys. Data freshly parsed from a response
+    body already has a deterministic key order (insertion order), so
+    callers hashing such data can pass canonical=False to skip the sort.
+    """
     
     if isinstance(data, (dict, list)):
-        # Convert to stable JSON string
-        content = json.dumps(data, sort_keys=True)
+        option = orjson.OPT_NON_STR_KEYS
+        if canonical:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, option=option)
     elif isinstance(data, str):
         content = data
     elif isinstance(data, bytes):
@@ -33,22 +44,77 @@ def calculate_content_hash(data: Any) -> str:
     else:
         content = str(data)
     
-    return hashlib.sha256(content.encode()).hexdigest()
+    return content.encode()
+
+
+def _hash_bytes(content: bytes) -> hashlib.blake2b:
+    """
+    BLAKE2b-256 over raw bytes
+    
+    content_hash is only used for change detection, not authenticity.
+    BLAKE2b is faster than SHA-256 on 64-bit CPUs and keeps the same
+    64-char hex width, so the column size is unchanged.
+    """
+    return hashlib.blake2b(content, digest_size=32)
+
+
+def calculate_content_hash(data: Any, canonical: bool = True) -> str:
+    """Calculate BLAKE2b-256 hash of data"""
+    return _hash_bytes(_content_bytes(data, canonical)).hexdigest()
+
+
+class IncrementalHasher:
+    """
+    Multiset hash for paginated responses
+    
+    Each page is hashed on its own and folded into the running state by
+    addition modulo 2**256, so the combined hash is built page by page
+    without re-serializing everything fetched so far. The result does not
+    depend on page order.
+    
+    Usage:
+        hasher = IncrementalHasher()
+        async for page in fetch_pages():
+            hasher.update(page)
+        content_hash = hasher.hexdigest()
+    """
+    
+    _MODULUS = 1 << 256
+    
+    def __init__(self):
+        self._state = 0
+        self.pages = 0
+    
+    def update(self, page: Any) -> None:
+        """Fold one page (raw bytes or parsed data) into the hash"""
+        
+        chunk = page if isinstance(page, bytes) else _content_bytes(page)
+        digest = _hash_bytes(chunk).digest()
+        self._state = (self._state + int.from_bytes(digest, "big")) % self._MODULUS
+        self.pages += 1
+    
+    def hexdigest(self) -> str:
+        """Hex digest of all pages seen so far (64 chars)"""
+        return format(self._state, "064x")
+
+
+# Common keys under which APIs nest their row list
+_ROW_KEYS = ('items', 'results', 'data', 'records')
 
 
 def count_rows(data: Any) -> int:
     """Count rows in data"""
     
-    if isinstance(data, list):
+    # Exact type checks: parsed JSON only ever yields plain list/dict
+    t = type(data)
+    if t is list:
         return len(data)
-    elif isinstance(data, dict):
-        # Look for common list keys
-        for key in ['items', 'results', 'data', 'records']:
-            if key in data and isinstance(data[key], list):
-                return len(data[key])
-        return 1
-    else:
-        return 1
+    if t is dict:
+        for key in _ROW_KEYS:
+            value = data.get(key)
+            if type(value) is list:
+                return len(value)
+    return 1
 
 
 def calculate_data_size(data: Any) -> int:
@@ -72,12 +138,25 @@ def create_metadata(
     content: Any,
     success: bool = True,
     error_message: str = None,
-    row_count: int = None
+    row_count: int = None,
+    canonical: bool = True,
+    content_hash: str = None,
+    data_size_bytes: int = None
 ) -> Dict[str, Any]:
-    """Create metadata dictionary for a fetch"""
+    """
+    Create metadata dictionary for a fetch
+    
+    content_hash / data_size_bytes can be passed when the caller already
+    has them (e.g. computed from the raw response bytes), which skips
+    re-serializing content.
+    """
     
-    content_hash = calculate_content_hash(content)
-    data_size = calculate_data_size(content)
+    if content_hash is None:
+        content_hash = calculate_content_hash(content, canonical)
+    
+    data_size = data_size_bytes
+    if data_size is None:
+        data_size = calculate_data_size(content)
     
     if row_count is None:
         row_count = count_rows(content)
@@ -97,6 +176,42 @@ def create_metadata(
     }
 
 
+def _store_metadata(metadata: Dict[str, Any]) -> None:
+    """
+    Persist a metadata dict as built by create_metadata
+
+    The stored row is read straight off the dict, so hash, size and row
+    count are computed once and what callers get back always matches
+    what was written.
+    """
+    store_fetch_records([FetchRecord(
+        source_id=metadata["source_id"],
+        source_url=metadata["source_url"],
+        status_code=metadata["status_code"],
+        response_time_ms=metadata["response_time_ms"],
+        content_hash=metadata["content_hash"],
+        row_count=metadata["row_count"],
+        success=metadata["success"],
+        error_message=metadata["error_message"],
+        data_size_bytes=metadata["data_size_bytes"]
+    )])
+
+
+def _store_failure(source_id: str, source_url: str, elapsed_ms: float, error: Exception) -> None:
+    """Persist a fetch that raised before any content was received"""
+    store_fetch_records([FetchRecord(
+        source_id=source_id,
+        source_url=source_url,
+        status_code=0,
+        response_time_ms=elapsed_ms,
+        content_hash="",
+        row_count=0,
+        success=False,
+        error_message=str(error),
+        data_quality_score=0.0
+    )])
+
+
 def enrich_data_with_metadata(data: Dict[str, Any], metadata: Dict[str, Any]) -> Dict[str, Any]:
     """Add metadata to data response"""
     
@@ -114,9 +229,16 @@ def track_fetch(source_id: str, source_name: str = None):
         @track_fetch("entsoe", "ENTSO-E Grid Data")
         async def get_entsoe_data(country_code: str):
             return await fetch_data()
+    
+    Paginated fetchers can be written as async generators yielding one
+    page at a time; each page is hashed as it passes through
+    (see IncrementalHasher) instead of buffering the whole payload.
     """
     
     def decorator(func):
+        if inspect.isasyncgenfunction(func):
+            return _track_paged_fetch(func, source_id)
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
             start_time = time.time()
@@ -139,16 +261,7 @@ def track_fetch(source_id: str, source_name: str = None):
                 )
                 
                 # Store in database
-                store_fetch_metadata(
-                    source_id=source_id,
-                    source_url=source_url,
-                    status_code=200,
-                    response_time_ms=elapsed_ms,
-                    content_hash=metadata["content_hash"],
-                    row_count=metadata["row_count"],
-                    success=True,
-                    data_size_bytes=metadata["data_size_bytes"]
-                )
+                _store_metadata(metadata)
                 
                 # Enrich result
                 if isinstance(result, dict):
@@ -160,17 +273,7 @@ def track_fetch(source_id: str, source_name: str = None):
                 elapsed_ms = (time.time() - start_time) * 1000
                 
                 # Store failure metadata
-                store_fetch_metadata(
-                    source_id=source_id,
-                    source_url=source_url,
-                    status_code=0,
-                    response_time_ms=elapsed_ms,
-                    content_hash="",
-                    row_count=0,
-                    success=False,
-                    error_message=str(e),
-                    data_quality_score=0.0
-                )
+                _store_failure(source_id, source_url, elapsed_ms, e)
                 
                 raise
         
@@ -178,6 +281,54 @@ def track_fetch(source_id: str, source_name: str = None):
     return decorator
 
 
+def _track_paged_fetch(func, source_id: str):
+    """track_fetch wrapper for async generators yielding pages"""
+    
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        start_time = time.time()
+        source_url = kwargs.get('url', 'unknown')
+        hasher = IncrementalHasher()
+        row_count = 0
+        data_size = 0
+        
+        try:
+            async for page in func(*args, **kwargs):
+                # Encode each page once; the hash and the size share the bytes
+                chunk = page if isinstance(page, bytes) else _content_bytes(page)
+                hasher.update(chunk)
+                row_count += count_rows(page)
+                data_size += len(chunk)
+                yield page
+            
+        except Exception as e:
+            elapsed_ms = (time.time() - start_time) * 1000
+            
+            # Store failure metadata
+            _store_failure(source_id, source_url, elapsed_ms, e)
+            
+            raise
+        
+        elapsed_ms = (time.time() - start_time) * 1000
+        
+        _store_metadata(create_metadata(
+            source_id=source_id,
+            source_url=source_url,
+            status_code=200,
+            response_time_ms=elapsed_ms,
+            content=None,
+            row_count=row_count,
+            content_hash=hasher.hexdigest(),
+            data_size_bytes=data_size
+        ))
+    
+    return wrapper
+
+
+# Distinct URLs (incl. query params) a TrackedHTTPClient keeps ETags for
+ETAG_CACHE_SIZE = 256
+
+
 class TrackedHTTPClient:
     """
     HTTP client that automatically tracks all requests
@@ -191,43 +342,79 @@ class TrackedHTTPClient:
         self.source_id = source_id
         self.source_name = source_name or source_id
         self.client = httpx.AsyncClient(timeout=30.0)
+        
+        # Same shape as create_metadata(); per-response values are filled
+        # in with dict(self._meta_tpl, ...) instead of rebuilding the dict
+        self._meta_tpl: Dict[str, Any] = {
+            "source_id": source_id,
+            "source_url": None,
+            "fetched_at": None,
+            "status_code": None,
+            "response_time_ms": None,
+            "content_hash": None,
+            "data_size_bytes": None,
+            "row_count": None,
+            "success": None,
+            "error_message": None,
+            "data_quality": None
+        }
+        
+        # request url (incl. query params) -> (etag, metadata, body, headers)
+        # of the last 200, least recently used first
+        self._etags: "OrderedDict[str, Tuple[str, Dict[str, Any], bytes, httpx.Headers]]" = OrderedDict()
     
     async def get(self, url: str, **kwargs) -> Tuple[httpx.Response, Dict[str, Any]]:
-        """GET request with tracking"""
+        """
+        GET request with tracking
+        
+        Sends If-None-Match when a previous response carried an ETag. On
+        304 Not Modified the caller still gets a 200 carrying the stored
+        body, and the stored content hash, size and row count are reused,
+        so unchanged upstreams cost no body download or hashing.
+        metadata["not_modified"] is True when that happened.
+        """
         
         start_time = time.time()
+        etag_key = str(httpx.URL(url, params=kwargs.get("params")))
+        cached = self._etags.get(etag_key)
+        
+        if cached:
+            self._etags.move_to_end(etag_key)
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers.setdefault("If-None-Match", cached[0])
+            kwargs["headers"] = headers
         
         try:
             response = await self.client.get(url, **kwargs)
             elapsed_ms = (time.time() - start_time) * 1000
             
-            # Parse content
-            try:
-                content = response.json()
-            except:
-                content = response.text
+            if response.status_code == 304 and cached:
+                _, prior, content, headers = cached
+                # Same body as the last 200
+                response = httpx.Response(
+                    200,
+                    headers=headers,
+                    content=content,
+                    request=response.request
+                )
+                metadata = {
+                    **prior,
+                    "fetched_at": datetime.utcnow().isoformat(),
+                    "status_code": 304,
+                    "response_time_ms": elapsed_ms,
+                    "not_modified": True
+                }
+                
+                _store_metadata(metadata)
+                
+                return response, metadata
             
-            # Create metadata
-            metadata = create_metadata(
-                source_id=self.source_id,
-                source_url=url,
-                status_code=response.status_code,
-                response_time_ms=elapsed_ms,
-                content=content,
-                success=response.status_code == 200
-            )
+            metadata = self._record_response(url, response, elapsed_ms)
             
-            # Store in database
-            store_fetch_metadata(
-                source_id=self.source_id,
-                source_url=url,
-                status_code=response.status_code,
-                response_time_ms=elapsed_ms,
-                content_hash=metadata["content_hash"],
-                row_count=metadata["row_count"],
-                success=response.status_code == 200,
-                data_size_bytes=metadata["data_size_bytes"]
-            )
+            # Remember the validator so the next GET can be conditional
+            etag = response.headers.get("ETag")
+            if response.status_code == 200 and etag:
+                self._remember_etag(etag_key, etag, metadata, response)
             
             return response, metadata
             
@@ -235,20 +422,24 @@ class TrackedHTTPClient:
             elapsed_ms = (time.time() - start_time) * 1000
             
             # Store failure
-            store_fetch_metadata(
-                source_id=self.source_id,
-                source_url=url,
-                status_code=0,
-                response_time_ms=elapsed_ms,
-                content_hash="",
-                row_count=0,
-                success=False,
-                error_message=str(e),
-                data_quality_score=0.0
-            )
+            _store_failure(self.source_id, url, elapsed_ms, e)
             
             raise
     
+    def _remember_etag(self, key: str, etag: str, metadata: Dict[str, Any], response: httpx.Response) -> None:
+        """Keep what a 304 needs to replay this 200, evicting the oldest entries"""
+        
+        # The stored bytes are already decoded, so the transfer headers
+        # must not be replayed with them
+        headers = httpx.Headers(response.headers)
+        for name in ("content-encoding", "content-length", "transfer-encoding"):
+            headers.pop(name, None)
+        
+        self._etags[key] = (etag, metadata, response.content, headers)
+        self._etags.move_to_end(key)
+        while len(self._etags) > ETAG_CACHE_SIZE:
+            self._etags.popitem(last=False)
+    
     async def post(self, url: str, **kwargs) -> Tuple[httpx.Response, Dict[str, Any]]:
         """POST request with tracking"""
         
@@ -258,33 +449,7 @@ class TrackedHTTPClient:
             response = await self.client.post(url, **kwargs)
             elapsed_ms = (time.time() - start_time) * 1000
             
-            # Parse content
-            try:
-                content = response.json()
-            except:
-                content = response.text
-            
-            # Create metadata
-            metadata = create_metadata(
-                source_id=self.source_id,
-                source_url=url,
-                status_code=response.status_code,
-                response_time_ms=elapsed_ms,
-                content=content,
-                success=response.status_code == 200
-            )
-            
-            # Store in database
-            store_fetch_metadata(
-                source_id=self.source_id,
-                source_url=url,
-                status_code=response.status_code,
-                response_time_ms=elapsed_ms,
-                content_hash=metadata["content_hash"],
-                row_count=metadata["row_count"],
-                success=response.status_code == 200,
-                data_size_bytes=metadata["data_size_bytes"]
-            )
+            metadata = self._record_response(url, response, elapsed_ms)
             
             return response, metadata
             
@@ -292,20 +457,49 @@ class TrackedHTTPClient:
             elapsed_ms = (time.time() - start_time) * 1000
             
             # Store failure
-            store_fetch_metadata(
-                source_id=self.source_id,
-                source_url=url,
-                status_code=0,
-                response_time_ms=elapsed_ms,
-                content_hash="",
-                row_count=0,
-                success=False,
-                error_message=str(e),
-                data_quality_score=0.0
-            )
+            _store_failure(self.source_id, url, elapsed_ms, e)
             
             raise
     
+    def _record_response(self, url: str, response: httpx.Response, elapsed_ms: float) -> Dict[str, Any]:
+        """
+        Build and store metadata for a completed response
+        
+        Hash and size come straight from the raw body bytes; the body is
+        only parsed to count rows, never re-serialized.
+        """
+        
+        raw = response.content
+        
+        # Parse content - only JSON bodies are decoded; anything else
+        # counts as a single row, so there is no need to build .text
+        content = None
+        if "json" in response.headers.get("content-type", ""):
+            try:
+                content = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        
+        # Create metadata
+        success = response.status_code == 200
+        metadata = dict(
+            self._meta_tpl,
+            source_url=url,
+            fetched_at=datetime.utcnow().isoformat(),
+            status_code=response.status_code,
+            response_time_ms=elapsed_ms,
+            content_hash=_hash_bytes(raw).hexdigest(),
+            data_size_bytes=len(raw),
+            row_count=count_rows(content),
+            success=success,
+            data_quality="good" if success else "error"
+        )
+        
+        # Store in database
+        _store_metadata(metadata)
+        
+        return metadata
+    
     async def close(self):
         """Close the HTTP client"""
         await self.client.aclose()
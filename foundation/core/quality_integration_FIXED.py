@@ -7,9 +7,12 @@ Fixed: Removed hardcoded paths, added flexible imports
 """
 
 from typing import Dict, Any
+import logging
 import sys
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Flexible import system - try multiple paths
 def setup_imports():
     """Setup imports with fallback paths"""
@@ -142,7 +145,7 @@ async def track_and_store_fetch(
         )
         
     except Exception as e:
-        print(f"Warning: Could not track fetch for {result.source_id}: {e}")
+        logger.warning("Could not track fetch for %s: %s", result.source_id, e)
 
 
 async def track_all_fetches(fetch_results: Dict[str, FetchResult]) -> None:
@@ -243,7 +246,7 @@ def ensure_database_initialized():
     try:
         init_database()
     except Exception as e:
-        print(f"Database initialization: {e}")
+        logger.error("Database initialization: %s", e)
 
 
 # Initialize on import
@@ -5,15 +5,16 @@ Defines expected schemas, types, and quality rules for each data source.
 Validates data against contracts to ensure quality.
 """
 
-from typing import Dict, Any, List, Tuple, Optional
-from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, List, Tuple, Optional, Union
+from datetime import datetime, timezone
 from dataclasses import dataclass
 from functools import wraps
+import time
 
 from .database import store_fetch_metadata
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """Represents a validation error"""
     field: str
@@ -58,9 +59,9 @@ DATA_CONTRACTS = {
             {"name": "nearest_connection", "type": "dict", "optional": True}
         ],
         "optional_fields": [
-            {"name": "site_name", "type": "str"},
-            {"name": "distance_km", "type": "float", "min": 0, "max": 200},
-            {"name": "capacity_mw", "type": "float", "min": 0, "max": 2000}
+            {"name": "site_name", "type": "str", "parent": "nearest_connection"},
+            {"name": "distance_km", "type": "float", "min": 0, "max": 200, "parent": "nearest_connection"},
+            {"name": "capacity_mw", "type": "float", "min": 0, "max": 2000, "parent": "nearest_connection"}
         ],
         "quality_checks": [
             "if nearest_connection: distance_km >= 0",
@@ -179,17 +180,235 @@ def get_all_contracts() -> Dict[str, Dict[str, Any]]:
     return DATA_CONTRACTS
 
 
-def validate_field(field_spec: Dict[str, Any], value: Any, field_name: str) -> List[ValidationError]:
+# Compiled fast path (optional: pip install fastjsonschema)
+#
+# Each contract is translated to a JSON Schema and compiled once at import.
+# A clean response passes the compiled validator and skips the per-field
+# walk in validate_data entirely; anything it rejects falls through to
+# that walk, which stays authoritative for the error list.
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+_JSONSCHEMA_TYPES = {
+    "float": "number",
+    "int": "integer",
+    "str": "string",
+    "bool": "boolean",
+    "list": "array",
+    "dict": "object"
+}
+
+# JSON Schema is looser than validate_field for these: "integer" accepts
+# 5.0 and "array" accepts tuples, so present values are re-checked exactly
+_EXACT_TYPES = {"int": int, "list": list}
+
+
+def _to_jsonschema(contract: Dict[str, Any]) -> Dict[str, Any]:
+    """Translate a data contract into an equivalent-or-stricter JSON Schema"""
+    
+    properties = {}
+    
+    for field_spec in contract.get("required_fields", []) + contract.get("optional_fields", []):
+        prop = {}
+        json_type = _JSONSCHEMA_TYPES.get(field_spec.get("type"))
+        if json_type:
+            prop["type"] = [json_type, "null"] if field_spec.get("optional") else json_type
+        if "min" in field_spec:
+            prop["minimum"] = field_spec["min"]
+        if "max" in field_spec:
+            prop["maximum"] = field_spec["max"]
+        if "enum" in field_spec:
+            prop["enum"] = list(field_spec["enum"])
+        properties[field_spec["name"]] = prop
+        
+        # Nested fields are checked both under their parent and at the top
+        # level (validate_data falls back to the top level without a parent)
+        parent = field_spec.get("parent")
+        if parent:
+            properties.setdefault(parent, {}).setdefault("properties", {})[field_spec["name"]] = prop
+    
+    required = [field_spec["name"] for field_spec in contract.get("required_fields", [])]
+    
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def _exact_type_checks(contract: Dict[str, Any]) -> Tuple[Tuple[Optional[str], str, type], ...]:
+    """(parent, field name, python type) triples JSON Schema can't check exactly"""
+    
+    return tuple(
+        (field_spec.get("parent"), field_spec["name"], _EXACT_TYPES[field_spec["type"]])
+        for field_spec in contract.get("required_fields", []) + contract.get("optional_fields", [])
+        if field_spec.get("type") in _EXACT_TYPES
+    )
+
+
+_COMPILED = {}
+_EXACT_CHECKS = {}
+
+if fastjsonschema is not None:
+    for _source_id, _contract in DATA_CONTRACTS.items():
+        _COMPILED[_source_id] = fastjsonschema.compile(_to_jsonschema(_contract))
+        _EXACT_CHECKS[_source_id] = _exact_type_checks(_contract)
+
+
+def _fast_accept(contract: "_PreparedContract", data: Any) -> bool:
+    """True if data passes the compiled contract (no errors possible)"""
+    
+    validator = contract.fast_validator
+    if validator is None:
+        return False
+    
+    try:
+        validator(data)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    
+    for parent, field_name, expected in contract.exact_checks:
+        value = _field_container(data, parent).get(field_name)
+        if value is not None and not isinstance(value, expected):
+            return False
+    
+    return True
+
+
+def _field_container(data: Dict[str, Any], parent: Optional[str]) -> Dict[str, Any]:
+    """The dict a field lives in: its parent if present, else the top level"""
+    
+    if parent is None:
+        return data
+    container = data.get(parent)
+    return container if isinstance(container, dict) and container else data
+
+
+def _is_float(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_bool(value: Any) -> bool:
+    return isinstance(value, bool)
+
+
+def _is_list(value: Any) -> bool:
+    return isinstance(value, list)
+
+
+def _is_dict(value: Any) -> bool:
+    return isinstance(value, dict)
+
+
+# Contract type name -> (checker, name used in error messages)
+_TYPE_CHECKERS: Dict[str, Tuple[Callable[[Any], bool], str]] = {
+    "float": (_is_float, "float"),
+    "int": (_is_int, "int"),
+    "str": (_is_str, "string"),
+    "bool": (_is_bool, "boolean"),
+    "list": (_is_list, "list"),
+    "dict": (_is_dict, "dict")
+}
+
+
+@dataclass(slots=True, frozen=True)
+class FieldSpec:
+    """
+    One field entry of a contract, with its rules as plain attributes
+    
+    checker is resolved from _TYPE_CHECKERS when the contract is prepared,
+    so validate_field never compares type names. parent names the dict the
+    field is nested in (e.g. "nearest_connection"), None for top level.
+    """
+    name: str
+    type: Optional[str] = None
+    min: Optional[float] = None
+    max: Optional[float] = None
+    enum: Optional[tuple] = None
+    not_null: bool = False
+    optional: bool = False
+    checker: Optional[Callable[[Any], bool]] = None
+    type_label: Optional[str] = None
+    parent: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, field_spec: Dict[str, Any]) -> "FieldSpec":
+        enum = field_spec.get("enum")
+        checker, type_label = _TYPE_CHECKERS.get(field_spec.get("type"), (None, None))
+        return cls(
+            name=field_spec["name"],
+            type=field_spec.get("type"),
+            min=field_spec.get("min"),
+            max=field_spec.get("max"),
+            enum=tuple(enum) if enum is not None else None,
+            not_null=bool(field_spec.get("not_null")),
+            optional=bool(field_spec.get("optional")),
+            checker=checker,
+            type_label=type_label,
+            parent=field_spec.get("parent")
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class _PreparedContract:
+    """Contract fields and freshness SLA extracted once at import"""
+    required: Tuple[FieldSpec, ...]
+    optional: Tuple[FieldSpec, ...]
+    sla_kind: Optional[str]  # "hours", "days" or None
+    sla_value: Optional[int]
+    max_lag_seconds: Optional[float]
+    fast_validator: Optional[Callable[[Any], Any]]  # compiled schema, if available
+    exact_checks: Tuple[Tuple[Optional[str], str, type], ...]
+
+
+def _prepare_contract(source_id: str, contract: Dict[str, Any]) -> _PreparedContract:
+    """Turn a DATA_CONTRACTS entry into a _PreparedContract"""
+    
+    sla = contract.get("freshness_sla", {})
+    if "max_lag_hours" in sla:
+        sla_kind, sla_value = "hours", sla["max_lag_hours"]
+        max_lag_seconds = sla_value * 3600.0
+    elif "max_lag_days" in sla:
+        sla_kind, sla_value = "days", sla["max_lag_days"]
+        max_lag_seconds = sla_value * 86400.0
+    else:
+        sla_kind, sla_value, max_lag_seconds = None, None, None
+    
+    return _PreparedContract(
+        required=tuple(FieldSpec.from_dict(f) for f in contract.get("required_fields", [])),
+        optional=tuple(FieldSpec.from_dict(f) for f in contract.get("optional_fields", [])),
+        sla_kind=sla_kind,
+        sla_value=sla_value,
+        max_lag_seconds=max_lag_seconds,
+        fast_validator=_COMPILED.get(source_id),
+        exact_checks=_EXACT_CHECKS.get(source_id, ())
+    )
+
+
+_CONTRACT_CACHE: Dict[str, _PreparedContract] = {
+    source_id: _prepare_contract(source_id, contract) for source_id, contract in DATA_CONTRACTS.items()
+}
+
+
+def validate_field(spec: FieldSpec, value: Any) -> List[ValidationError]:
     """Validate a single field against its specification"""
     
     errors = []
+    field_name = spec.name
     
     # Skip if field is optional and value is None
-    if field_spec.get("optional") and value is None:
+    if spec.optional and value is None:
         return errors
     
     # Check not null
-    if field_spec.get("not_null") and value is None:
+    if spec.not_null and value is None:
         errors.append(ValidationError(
             field=field_name,
             message=f"{field_name} cannot be null",
@@ -199,79 +418,37 @@ def validate_field(field_spec: Dict[str, Any], value: Any, field_name: str) -> L
         return errors
     
     # Type check
-    expected_type = field_spec.get("type")
-    if expected_type == "float":
-        if not isinstance(value, (int, float)):
-            errors.append(ValidationError(
-                field=field_name,
-                message=f"Expected float, got {type(value).__name__}",
-                severity="error",
-                actual_value=value
-            ))
-    elif expected_type == "int":
-        if not isinstance(value, int) or isinstance(value, bool):
-            errors.append(ValidationError(
-                field=field_name,
-                message=f"Expected int, got {type(value).__name__}",
-                severity="error",
-                actual_value=value
-            ))
-    elif expected_type == "str":
-        if not isinstance(value, str):
-            errors.append(ValidationError(
-                field=field_name,
-                message=f"Expected string, got {type(value).__name__}",
-                severity="error",
-                actual_value=value
-            ))
-    elif expected_type == "bool":
-        if not isinstance(value, bool):
-            errors.append(ValidationError(
-                field=field_name,
-                message=f"Expected boolean, got {type(value).__name__}",
-                severity="error",
-                actual_value=value
-            ))
-    elif expected_type == "list":
-        if not isinstance(value, list):
-            errors.append(ValidationError(
-                field=field_name,
-                message=f"Expected list, got {type(value).__name__}",
-                severity="error",
-                actual_value=value
-            ))
-    elif expected_type == "dict":
-        if not isinstance(value, dict):
-            errors.append(ValidationError(
-                field=field_name,
-                message=f"Expected dict, got {type(value).__name__}",
-                severity="error",
-                actual_value=value
-            ))
+    if spec.checker is not None and not spec.checker(value):
+        errors.append(ValidationError(
+            field=field_name,
+            message=f"Expected {spec.type_label}, got {type(value).__name__}",
+            severity="error",
+            actual_value=value
+        ))
     
     # Range checks (only for numeric types)
     if isinstance(value, (int, float)) and not isinstance(value, bool):
-        if "min" in field_spec and value < field_spec["min"]:
+        if spec.min is not None and value < spec.min:
             errors.append(ValidationError(
                 field=field_name,
-                message=f"{field_name} = {value} below minimum {field_spec['min']}",
+                message=f"{field_name} = {value} below minimum {spec.min}",
                 severity="error",
                 actual_value=value
             ))
         
-        if "max" in field_spec and value > field_spec["max"]:
+        if spec.max is not None and value > spec.max:
             errors.append(ValidationError(
                 field=field_name,
-                message=f"{field_name} = {value} above maximum {field_spec['max']}",
+                message=f"{field_name} = {value} above maximum {spec.max}",
                 severity="error",
                 actual_value=value
             ))
     
     # Enum check
-    if "enum" in field_spec and value not in field_spec["enum"]:
+    if spec.enum is not None and value not in spec.enum:
         errors.append(ValidationError(
             field=field_name,
-            message=f"{field_name} must be one of {field_spec['enum']}, got {value}",
+            message=f"{field_name} must be one of {list(spec.enum)}, got {value}",
             severity="error",
             actual_value=value
         ))
@@ -287,64 +464,70 @@ def validate_data(source_id: str, data: Dict[str, Any]) -> Tuple[bool, List[Vali
         (is_valid, errors, quality_score)
     """
     
-    contract = get_contract(source_id)
+    contract = _CONTRACT_CACHE.get(source_id)
     
     if not contract:
         # No contract = no validation
         return True, [], 1.0
     
+    return validate_prepared(contract, data)
+
+
+def validate_prepared(contract: _PreparedContract, data: Dict[str, Any]) -> Tuple[bool, List[ValidationError], float]:
+    """validate_data for an already-resolved contract (see validate_response)"""
+    
+    # Clean data needs no per-field walk
+    if _fast_accept(contract, data):
+        return True, [], 1.0
+    
     errors = []
     
     # Check required fields
-    for field_spec in contract.get("required_fields", []):
-        field_name = field_spec["name"]
+    for spec in contract.required:
+        field_name = spec.name
+        container = _field_container(data, spec.parent)
         
-        # Check if field exists in data or nested in data
-        if field_name not in data:
-            # Check if it's nested (e.g., in "nearest_connection")
-            found = False
-            for key, value in data.items():
-                if isinstance(value, dict) and field_name in value:
-                    found = True
-                    field_errors = validate_field(field_spec, value[field_name], field_name)
-                    errors.extend(field_errors)
-                    break
-            
-            if not found and not field_spec.get("optional"):
-                errors.append(ValidationError(
-                    field=field_name,
-                    message=f"Required field {field_name} is missing",
-                    severity="error"
-                ))
-        else:
-            # Field exists at top level
-            value = data[field_name]
-            field_errors = validate_field(field_spec, value, field_name)
-            errors.extend(field_errors)
+        if field_name in container:
+            errors.extend(validate_field(spec, container[field_name]))
+        elif not spec.optional:
+            errors.append(ValidationError(
+                field=field_name,
+                message=f"Required field {field_name} is missing",
+                severity="error"
+            ))
     
     # Check optional fields if present
-    for field_spec in contract.get("optional_fields", []):
-        field_name = field_spec["name"]
+    for spec in contract.optional:
+        field_name = spec.name
+        container = _field_container(data, spec.parent)
         
-        if field_name in data:
-            value = data[field_name]
-            field_errors = validate_field(field_spec, value, field_name)
-            errors.extend(field_errors)
+        if field_name in container:
+            errors.extend(validate_field(spec, container[field_name]))
     
-    # Run quality checks
-    # (These are simplified - in production, use a proper expression evaluator)
-    for check in contract.get("quality_checks", []):
-        # This is a simplified implementation
-        # In production, use ast.literal_eval or a safe expression evaluator
-        pass
+    # Quality checks (contract "quality_checks") are documentation only -
+    # evaluating them needs a proper expression evaluator
     
-    # Calculate quality score
-    quality_score = calculate_quality_score(errors)
+    if not errors:
+        return True, errors, 1.0
     
-    # Is valid if no critical errors
-    is_valid = all(e.severity != "error" for e in errors)
+    # One pass over errors gives both validity (no critical errors) and score
+    error_count, warning_count = _count_severities(errors)
     
-    return is_valid, errors, quality_score
+    return error_count == 0, errors, _score_from_counts(error_count, warning_count)
+
+
+def _count_severities(errors: List[ValidationError]) -> Tuple[int, int]:
+    """(error_count, warning_count) in a single pass"""
+    
+    error_count = 0
+    warning_count = 0
+    for e in errors:
+        if e.severity == "error":
+            error_count += 1
+        elif e.severity == "warning":
+            warning_count += 1
+    
+    return error_count, warning_count
 
 
 def calculate_quality_score(errors: List[ValidationError]) -> float:
@@ -364,9 +547,11 @@ def calculate_quality_score(errors: List[ValidationError]) -> float:
     if not errors:
         return 1.0
     
-    # Count error types
-    error_count = sum(1 for e in errors if e.severity == "error")
-    warning_count = sum(1 for e in errors if e.severity == "warning")
+    return _score_from_counts(*_count_severities(errors))
+
+
+def _score_from_counts(error_count: int, warning_count: int) -> float:
+    """Quality score for a non-empty error list (see calculate_quality_score)"""
     
     if error_count == 0 and warning_count > 0:
         return 0.9  # Only warnings
@@ -380,29 +565,34 @@ def calculate_quality_score(errors: List[ValidationError]) -> float:
         return 0.1
 
 
-def validate_freshness(source_id: str, fetched_at: datetime) -> Tuple[bool, str]:
-    """Check if data is fresh according to SLA"""
+def validate_freshness(source_id: str, fetched_at: Union[datetime, float]) -> Tuple[bool, str]:
+    """
+    Check if data is fresh according to SLA
+    
+    fetched_at is either a UTC datetime (naive, as stored by the metadata
+    layer) or epoch seconds. Passing epoch seconds skips the datetime
+    conversion; the check itself is one float comparison.
+    """
     
-    contract = get_contract(source_id)
+    contract = _CONTRACT_CACHE.get(source_id)
     
     if not contract:
         return True, "No freshness SLA defined"
     
-    sla = contract.get("freshness_sla", {})
+    if contract.max_lag_seconds is None:
+        return True, "Data is fresh"
     
-    if "max_lag_hours" in sla:
-        max_lag = timedelta(hours=sla["max_lag_hours"])
-        age = datetime.utcnow() - fetched_at
-        
-        if age > max_lag:
-            return False, f"Data stale: {age.total_seconds()/3600:.1f}h > {sla['max_lag_hours']}h SLA"
+    if isinstance(fetched_at, datetime):
+        if fetched_at.tzinfo is None:
+            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+        fetched_at = fetched_at.timestamp()
     
-    elif "max_lag_days" in sla:
-        max_lag = timedelta(days=sla["max_lag_days"])
-        age = datetime.utcnow() - fetched_at
-        
-        if age > max_lag:
-            return False, f"Data stale: {age.days}d > {sla['max_lag_days']}d SLA"
+    age_seconds = time.time() - fetched_at
+    
+    if age_seconds > contract.max_lag_seconds:
+        if contract.sla_kind == "hours":
+            return False, f"Data stale: {age_seconds/3600:.1f}h > {contract.sla_value}h SLA"
+        return False, f"Data stale: {int(age_seconds // 86400)}d > {contract.sla_value}d SLA"
     
     return True, "Data is fresh"
 
@@ -415,14 +605,31 @@ def enrich_data_with_validation(
 ) -> Dict[str, Any]:
     """Add validation results to data response"""
     
-    if isinstance(data, dict):
+    if not isinstance(data, dict):
+        return data
+    
+    # Common case: clean data, nothing to count
+    if not errors:
         data["_validation"] = {
             "is_valid": is_valid,
             "quality_score": quality_score,
-            "error_count": sum(1 for e in errors if e.severity == "error"),
-            "warning_count": sum(1 for e in errors if e.severity == "warning"),
-            "errors": [e.to_dict() for e in errors]
+            "error_count": 0,
+            "warning_count": 0,
+            "errors": []
         }
+        return data
+    
+    error_count, warning_count = _count_severities(errors)
+    data["_validation"] = {
+        "is_valid": is_valid,
+        "quality_score": quality_score,
+        "error_count": error_count,
+        "warning_count": warning_count,
+        "errors": [
+            {"field": e.field, "message": e.message, "severity": e.severity, "actual_value": e.actual_value}
+            for e in errors
+        ]
+    }
     
     return data
 
@@ -435,8 +642,15 @@ def validate_response(source_id: str):
         @validate_response("entsoe")
         async def get_entsoe_data(country_code: str):
             return await fetch_data()
+    
+    Raises KeyError at decoration time if source_id has no contract.
     """
     
+    try:
+        contract = _CONTRACT_CACHE[source_id]
+    except KeyError:
+        raise KeyError(f"No data contract for source '{source_id}'") from None
+    
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -444,7 +658,7 @@ def validate_response(source_id: str):
             result = await func(*args, **kwargs)
             
             # Validate
-            is_valid, errors, quality_score = validate_data(source_id, result)
+            is_valid, errors, quality_score = validate_prepared(contract, result)
             
             # Enrich result
             result = enrich_data_with_validation(result, is_valid, errors, quality_score)
@@ -9,12 +9,14 @@ CRITICAL FIX: Now accepts BOTH simple and complex request formats:
 This ensures compatibility with the enhanced frontend.
 """
 
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, Field
 import httpx
+import orjson
 import os
-import math
+import numpy as np
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 import asyncio
@@ -22,23 +24,58 @@ import logging
 import json
 import time
 import hashlib
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
 from functools import wraps
 
+from upstream import (
+    DEFAULT_POWER_KW,
+    MAX_VALID_POWER_KW,
+    MIN_VALID_POWER_KW,
+    OPENCHARGEMAP_API_KEY,
+    UPSTREAM_CONNECT_TIMEOUT,
+    close_http_client,
+    geocode_postcode,
+    get_http_client,
+    parse_ocm_pois,
+    warm_haversine_kernel,
+    warm_http_client,
+)
+
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
-logging.basicConfig(level=logging.INFO)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+_log_level_valid = LOG_LEVEL in logging.getLevelNamesMapping()
+if not _log_level_valid:
+    # basicConfig raises on unknown names; a typo must not stop the app
+    LOG_LEVEL = "INFO"
+logging.basicConfig(level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
+if not _log_level_valid:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", os.getenv("LOG_LEVEL"))
 
 # ============================================================================
 # FastAPI App Setup
 # ============================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the shared HTTP client for the app's lifetime (see STARTUP)"""
+    startup_event()
+    # The kernel compile is CPU-bound; run it off the event loop alongside
+    # the connection warm-up
+    await asyncio.gather(asyncio.to_thread(warm_haversine_kernel), warm_http_client())
+    try:
+        yield
+    finally:
+        await close_http_client()
+
 app = FastAPI(
     title="EVL v10.1 + Day 1-5 Complete",
     description="EV Location Analyzer - Production Ready with All Enhancements",
-    version="10.1+day1-5"
+    version="10.1+day1-5",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -48,13 +85,21 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# JSON compresses well; bodies under 1 KB aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # ============================================================================
 # REQUEST MODELS - SUPPORTS BOTH SIMPLE AND COMPLEX FORMATS
 # ============================================================================
 
+# Request bodies are only read, never mutated: freeze them and drop (rather
+# than store) any unknown keys the frontend sends
+REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
 class SimpleLocationInput(BaseModel):
     """Simple input model (flat structure)"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     postcode: Optional[str] = None
     lat: Optional[float] = None
     lon: Optional[float] = None
@@ -62,28 +107,38 @@ class SimpleLocationInput(BaseModel):
 
 class NestedLocation(BaseModel):
     """Nested location object for complex format"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     postcode: Optional[str] = None
     lat: Optional[float] = None
     lon: Optional[float] = None
 
 class PlannedInstallation(BaseModel):
     """Planned installation details"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     charger_type: Optional[str] = "DC"
     power_per_plug_kw: Optional[float] = 150.0
     plugs: Optional[int] = 2
 
 class FinancialParams(BaseModel):
     """Financial parameters"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     energy_cost_per_kwh: Optional[float] = 0.20
     tariff_per_kwh: Optional[float] = 0.50
     fixed_costs_per_month: Optional[float] = 500.0
 
 class AnalysisOptions(BaseModel):
     """Analysis options"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     include_raw_sources: Optional[bool] = False
 
 class ComplexLocationInput(BaseModel):
     """Complex input model (nested structure from frontend)"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     location: Optional[NestedLocation] = None
     radius_km: float = Field(default=5.0)
     planned_installation: Optional[PlannedInstallation] = None
@@ -110,21 +165,17 @@ DEFAULT_AADT = 15000
 MIN_VALID_AADT = 100
 MAX_VALID_AADT = 200000
 
-# M-3: Power validation
-DEFAULT_POWER_KW = 7.0
-MIN_VALID_POWER_KW = 1.0
-MAX_VALID_POWER_KW = 500.0
-
 # ============================================================================
 # DAY 5: PRODUCTION - RESPONSE CACHING
 # ============================================================================
 
 class ResponseCache:
-    """Simple response caching system"""
+    """Simple response caching system (TTL + LRU, bounded to max_size entries)"""
     
-    def __init__(self, ttl_seconds: int = 1800):
+    def __init__(self, ttl_seconds: int = 1800, max_size: int = 1024):
         self.ttl_seconds = ttl_seconds
-        self.cache: Dict[str, tuple[Any, float]] = {}
+        self.max_size = max_size
+        self.cache: "OrderedDict[str, tuple[Any, float]]" = OrderedDict()
         self.hits = 0
         self.misses = 0
     
@@ -136,6 +187,7 @@ class ResponseCache:
         if key in self.cache:
             value, expires_at = self.cache[key]
             if time.time() < expires_at:
+                self.cache.move_to_end(key)
                 self.hits += 1
                 return value
             else:
@@ -146,6 +198,9 @@ class ResponseCache:
     def set(self, key: str, value: Any) -> None:
         expires_at = time.time() + self.ttl_seconds
         self.cache[key] = (value, expires_at)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.max_size:
+            self.cache.popitem(last=False)
     
     def stats(self) -> Dict[str, Any]:
         total = self.hits + self.misses
@@ -157,20 +212,37 @@ class ResponseCache:
             "cached_items": len(self.cache)
         }
 
-_cache = ResponseCache(ttl_seconds=1800)
+_cache = ResponseCache(ttl_seconds=1800, max_size=1024)
+
+# cache key -> task still computing it, so a burst of identical misses
+# shares one upstream call instead of each making its own
+_inflight: Dict[str, "asyncio.Task"] = {}
 
 def cached(ttl_seconds: int = 1800):
     """Decorator to cache async function results"""
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            cache_key = _cache.get_cache_key(*args, **kwargs)
+            # Function name is part of the key: fetchers share argument lists
+            cache_key = _cache.get_cache_key(func.__qualname__, *args, **kwargs)
             cached_value = _cache.get(cache_key)
             if cached_value is not None:
-                logger.debug(f"Cache hit for {func.__name__}")
+                logger.debug("Cache hit for %s", func.__name__)
                 return cached_value
-            logger.debug(f"Cache miss for {func.__name__}")
-            result = await func(*args, **kwargs)
+            
+            task = _inflight.get(cache_key)
+            if task is not None:
+                logger.debug("Joining in-flight %s", func.__name__)
+                return await asyncio.shield(task)
+            
+            logger.debug("Cache miss for %s", func.__name__)
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            _inflight[cache_key] = task
+            try:
+                # Shielded: a cancelled caller must not cancel the joiners' fetch
+                result = await asyncio.shield(task)
+            finally:
+                _inflight.pop(cache_key, None)
             _cache.set(cache_key, result)
             return result
         return wrapper
@@ -241,21 +313,6 @@ class PerformanceMonitor:
 
 _perf_monitor = PerformanceMonitor()
 
-# ============================================================================
-# UTILITY FUNCTIONS
-# ============================================================================
-
-def distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance in km using Haversine formula"""
-    R = 6371
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = (math.sin(dlat/2)**2 + 
-         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * 
-         math.sin(dlon/2)**2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    return round(R * c, 2)
-
 # ============================================================================
 # C-3: COORDINATE VALIDATION
 # ============================================================================
@@ -291,13 +348,13 @@ def validate_radius(radius_km: float, context: str = "unknown") -> tuple:
 def validate_aadt(aadt: Any, road_id: str = "unknown") -> tuple:
     """Validate AADT value"""
     if not isinstance(aadt, (int, float)):
-        logger.warning(f"AADT validation failed for {road_id}: non-numeric")
+        logger.warning("AADT validation failed for %s: non-numeric", road_id)
         return DEFAULT_AADT, False
     if aadt <= 0:
-        logger.warning(f"AADT validation failed for {road_id}: non-positive")
+        logger.warning("AADT validation failed for %s: non-positive", road_id)
         return DEFAULT_AADT, False
     if aadt < MIN_VALID_AADT or aadt > MAX_VALID_AADT:
-        logger.warning(f"AADT validation warning for {road_id}: out of range")
+        logger.warning("AADT validation warning for %s: out of range", road_id)
         return DEFAULT_AADT, False
     return int(aadt), True
 
@@ -308,16 +365,16 @@ def validate_aadt(aadt: Any, road_id: str = "unknown") -> tuple:
 def validate_power_kw(power_kw: Any, charger_id: str = "unknown") -> tuple:
     """Validate charger power"""
     if not isinstance(power_kw, (int, float)):
-        logger.warning(f"Power validation failed for {charger_id}: non-numeric")
+        logger.warning("Power validation failed for %s: non-numeric", charger_id)
         return DEFAULT_POWER_KW, False
     if power_kw <= 0:
-        logger.warning(f"Power validation failed for {charger_id}: non-positive")
+        logger.warning("Power validation failed for %s: non-positive", charger_id)
         return DEFAULT_POWER_KW, False
     if power_kw < MIN_VALID_POWER_KW:
-        logger.warning(f"Power validation failed for {charger_id}: too low")
+        logger.warning("Power validation failed for %s: too low", charger_id)
         return DEFAULT_POWER_KW, False
     if power_kw > MAX_VALID_POWER_KW:
-        logger.warning(f"Power validation failed for {charger_id}: too high")
+        logger.warning("Power validation failed for %s: too high", charger_id)
         return MAX_VALID_POWER_KW, False
     return float(power_kw), True
 
@@ -329,26 +386,23 @@ def validate_power_kw(power_kw: Any, charger_id: str = "unknown") -> tuple:
 async def fetch_opencharge_map(lat: float, lon: float, radius_km: float = 5.0) -> Dict[str, Any]:
     """Fetch chargers with C-7 logging and M-3 power validation"""
     
-    api_key = os.getenv("OPENCHARGEMAP_API_KEY", "")
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.openchargemap.io/v3/poi/",
-                params={
-                    "output": "json",
-                    "latitude": lat,
-                    "longitude": lon,
-                    "distance": radius_km,
-                    "distanceunit": "km",
-                    "maxresults": 100,
-                    "compact": "false",
-                    "key": api_key
-                },
-                timeout=15.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client().get(
+            "https://api.openchargemap.io/v3/poi/",
+            params={
+                "output": "json",
+                "latitude": lat,
+                "longitude": lon,
+                "distance": radius_km,
+                "distanceunit": "km",
+                "maxresults": 100,
+                "compact": "false",
+                "key": OPENCHARGEMAP_API_KEY
+            },
+            timeout=httpx.Timeout(15.0, connect=UPSTREAM_CONNECT_TIMEOUT)
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
         if not data:
             return {
@@ -358,89 +412,48 @@ async def fetch_opencharge_map(lat: float, lon: float, radius_km: float = 5.0) -
                 "by_power": {"slow_ac": 0, "fast_dc": 0, "rapid_dc": 0}
             }
         
-        chargers = []
-        parse_errors = []
-        power_valid_count = 0
-        power_invalid_count = 0
-        
-        slow_ac = 0
-        fast_dc = 0
-        rapid_dc = 0
+        # C-7 parse errors and M-3 power validation, one column at a time
+        cols = parse_ocm_pois(data, lat, lon, validate_power_kw)
+        parse_errors = cols["parse_errors"]
+        power_valid_count = int(np.count_nonzero(cols["valid"]))
         
-        for poi in data:
-            try:
-                address_info = poi.get("AddressInfo", {})
-                connections = poi.get("Connections", [])
-                charger_id = str(poi.get("ID", "unknown"))
-                
-                raw_power = 0
-                if connections and len(connections) > 0:
-                    raw_power = connections[0].get("PowerKW", 0) or 0
-                
-                # M-3: VALIDATE POWER
-                validated_power, is_valid = validate_power_kw(raw_power, charger_id)
-                
-                if is_valid:
-                    power_valid_count += 1
-                else:
-                    power_invalid_count += 1
-                
-                # Categorize by power
-                if validated_power >= 150:
-                    rapid_dc += 1
-                elif validated_power >= 50:
-                    fast_dc += 1
-                else:
-                    slow_ac += 1
-                
-                charger_data = {
-                    "id": poi.get("ID"),
-                    "name": address_info.get("Title", "Unknown"),
-                    "lat": address_info.get("Latitude"),
-                    "lon": address_info.get("Longitude"),
-                    "power_kw": validated_power,
-                    "status": poi.get("StatusType", {}).get("Title", "Unknown"),
-                    "operator": poi.get("OperatorInfo", {}).get("Title", "Unknown"),
-                }
-                
-                if charger_data["lat"] and charger_data["lon"]:
-                    charger_data["distance_km"] = distance(
-                        lat, lon,
-                        charger_data["lat"], charger_data["lon"]
-                    )
-                
-                chargers.append(charger_data)
-                
-            except Exception as e:
-                # C-7: LOG PARSING ERRORS
-                poi_id = poi.get("ID", "unknown")
-                logger.error(f"Failed to parse POI {poi_id}: {e}")
-                parse_errors.append({"poi_id": poi_id, "error": str(e)})
-                continue
+        chargers = [
+            {
+                "id": charger_id,
+                "name": name,
+                "lat": poi_lat,
+                "lon": poi_lon,
+                "power_kw": power,
+                "status": status,
+                "operator": operator,
+            }
+            for charger_id, name, poi_lat, poi_lon, power, status, operator
+            in zip(cols["ids"], cols["names"], cols["lats"], cols["lons"],
+                   cols["powers"].tolist(), cols["statuses"], cols["operators"])
+        ]
+        for charger, dist in zip(chargers, cols["distances"]):
+            if dist is not None:
+                charger["distance_km"] = dist
         
         # C-7: Log summary
-        logger.info(f"Parsed {len(chargers)}/{len(data)} chargers successfully")
+        logger.debug("Parsed %d/%d chargers successfully", len(chargers), len(data))
         if parse_errors:
-            logger.warning(f"{len(parse_errors)} chargers failed to parse")
+            logger.warning("%d chargers failed to parse", len(parse_errors))
         
         # M-3: Log power validation
-        if chargers:
-            logger.info(f"Power validation: {power_valid_count}/{len(chargers)} valid ({power_valid_count/len(chargers)*100:.1f}%)")
+        if chargers and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Power validation: %d/%d valid (%.1f%%)", power_valid_count, len(chargers), power_valid_count / len(chargers) * 100)
         
         return {
             "success": True,
             "chargers": chargers,
             "count": len(chargers),
-            "by_power": {
-                "slow_ac": slow_ac,
-                "fast_dc": fast_dc,
-                "rapid_dc": rapid_dc
-            },
+            "by_power": cols["by_power"],
             "power_validation_rate": power_valid_count / len(chargers) if chargers else 1.0
         }
         
     except Exception as e:
-        logger.error(f"OpenChargeMap fetch failed: {e}")
+        logger.error("OpenChargeMap fetch failed: %s", e)
         return {
             "success": False,
             "chargers": [],
@@ -463,19 +476,16 @@ async def fetch_traffic_data(lat: float, lon: float, radius_km: float = 2.0) ->
           way["highway"~"motorway|trunk|primary|secondary"]
             (around:{radius_m},{lat},{lon});
         );
-        out body;
-        >;
-        out skel qt;
+        out tags;
         """
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                overpass_url,
-                data={"data": query},
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client().post(
+            overpass_url,
+            data={"data": query},
+            timeout=httpx.Timeout(30.0, connect=UPSTREAM_CONNECT_TIMEOUT)
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
         if not data.get("elements"):
             return {"success": True, "avg_aadt": DEFAULT_AADT, "road_count": 0}
@@ -517,9 +527,37 @@ async def fetch_traffic_data(lat: float, lon: float, radius_km: float = 2.0) ->
         }
         
     except Exception as e:
-        logger.error(f"Traffic fetch failed: {e}")
+        logger.error("Traffic fetch failed: %s", e)
         return {"success": False, "avg_aadt": DEFAULT_AADT, "error": str(e)}
 
+
+# Fan-out guard: caps in-flight upstream calls across concurrent analyses and
+# bounds each provider by a latency budget, so one slow upstream degrades to
+# its fallback instead of holding the whole response
+UPSTREAM_CONCURRENCY = 16
+UPSTREAM_BUDGET_SECONDS = 8.0
+_upstream_semaphore = asyncio.Semaphore(UPSTREAM_CONCURRENCY)
+
+
+async def guarded_fetch(coro, fallback: Dict[str, Any], name: str) -> Dict[str, Any]:
+    """Run a fetcher under the shared limiter and budget; fallback on failure"""
+    try:
+        # The budget covers the wait for a slot too, so a saturated limiter
+        # can't stretch latency past it. asyncio.timeout runs the fetch in
+        # this task; wait_for would wrap it in another one
+        async with asyncio.timeout(UPSTREAM_BUDGET_SECONDS):
+            async with _upstream_semaphore:
+                return await coro
+    except TimeoutError:
+        logger.warning("%s exceeded %gs budget, using fallback", name, UPSTREAM_BUDGET_SECONDS)
+        return fallback
+    except Exception as e:
+        logger.error("%s fetch failed: %s", name, e)
+        return {**fallback, "error": str(e)}
+    finally:
+        # No-op once the fetch ran; stops a never-started one from warning
+        coro.close()
+
 # ============================================================================
 # DAY 3: V2.2 ENHANCEMENTS - COMPETITIVE GAP ANALYSIS
 # ============================================================================
@@ -539,6 +577,8 @@ def analyze_competitive_gaps(
     
     gaps = []
     blue_ocean_opportunities = []
+    total_gap = 0
+    opportunity_total = 0.0
     
     for power_level in ["7kW", "22kW", "50kW", "150kW+"]:
         current = power_breakdown.get(power_level, 0)
@@ -570,6 +610,9 @@ def analyze_competitive_gaps(
         }
         
         gaps.append(gap)
+        if gap_size > 0:
+            total_gap += gap_size
+        opportunity_total += gap["opportunity_score"]
         
         if is_blue_ocean:
             blue_ocean_opportunities.append({
@@ -578,8 +621,7 @@ def analyze_competitive_gaps(
                 "description": f"Blue Ocean: {power_level} chargers severely underserved. Only {current} vs market average of {market_avg}."
             })
     
-    total_gap = sum(g["gap_size"] for g in gaps if g["gap_size"] > 0)
-    avg_opportunity = sum(g["opportunity_score"] for g in gaps) / len(gaps)
+    avg_opportunity = opportunity_total / len(gaps)
     
     return {
         "power_breakdown": power_breakdown,
@@ -788,7 +830,7 @@ def generate_enhanced_opportunities(
 # ============================================================================
 
 @app.post("/api/v2/analyze-location")
-async def analyze_location_v2(request: ComplexLocationInput):
+async def analyze_location_v2(request: ComplexLocationInput) -> Response:
     """
     Complete V2 analysis - ACCEPTS BOTH SIMPLE AND COMPLEX REQUEST FORMATS
     
@@ -815,26 +857,18 @@ async def analyze_location_v2(request: ComplexLocationInput):
     # Geocode if needed
     if postcode and not (lat and lon):
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://nominatim.openstreetmap.org/search",
-                    params={"q": postcode, "format": "json", "limit": 1},
-                    headers={"User-Agent": "EVL-V2/2.2"},
-                    timeout=10.0
-                )
-                data = response.json()
-                if data:
-                    lat = float(data[0]["lat"])
-                    lon = float(data[0]["lon"])
-                    is_valid, error = validate_coordinates(lat, lon, "geocoding")
-                    if not is_valid:
-                        raise HTTPException(status_code=400, detail=error)
-                else:
-                    raise HTTPException(status_code=404, detail="Location not found")
+            coords = await geocode_postcode(postcode)
+            if coords:
+                lat, lon = coords
+                is_valid, error = validate_coordinates(lat, lon, "geocoding")
+                if not is_valid:
+                    raise HTTPException(status_code=400, detail=error)
+            else:
+                raise HTTPException(status_code=404, detail="Location not found")
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Geocoding failed: {e}")
+            logger.error("Geocoding failed: %s", e)
             raise HTTPException(status_code=500, detail="Geocoding failed")
     
     if not (lat and lon):
@@ -849,11 +883,24 @@ async def analyze_location_v2(request: ComplexLocationInput):
     if not is_valid:
         raise HTTPException(status_code=400, detail=error)
     
-    logger.info(f"V2.2 Analysis: lat={lat}, lon={lon}, radius={radius_km}km")
+    logger.debug("V2.2 Analysis: lat=%s, lon=%s, radius=%skm", lat, lon, radius_km)
     
-    # Fetch data
-    charger_data = await fetch_opencharge_map(lat, lon, radius_km)
-    traffic_data = await fetch_traffic_data(lat, lon, radius_km)
+    # Fetch data - both upstreams in parallel (each handles its own errors).
+    # Coordinates are snapped to a ~11 m grid so repeat analyses of the same
+    # site (slightly different geocodes/clicks) hit the fetcher cache
+    fetch_lat, fetch_lon, fetch_radius = round(lat, 4), round(lon, 4), round(radius_km, 2)
+    async with asyncio.TaskGroup() as tg:
+        charger_task = tg.create_task(guarded_fetch(
+            fetch_opencharge_map(fetch_lat, fetch_lon, fetch_radius),
+            {"success": False, "chargers": [], "count": 0, "error": "timeout"},
+            "OpenChargeMap"
+        ))
+        traffic_task = tg.create_task(guarded_fetch(
+            fetch_traffic_data(fetch_lat, fetch_lon, fetch_radius),
+            {"success": False, "avg_aadt": DEFAULT_AADT, "error": "timeout"},
+            "Traffic"
+        ))
+    charger_data, traffic_data = charger_task.result(), traffic_task.result()
     
     # Calculate scores
     charger_count = charger_data.get("count", 0)
@@ -894,11 +941,12 @@ async def analyze_location_v2(request: ComplexLocationInput):
     payback_years = round(capex / annual_profit, 1) if annual_profit > 0 else 999
     
     # DAY 3: COMPETITIVE GAP ANALYSIS
+    by_power = charger_data.get("by_power", {})
     power_breakdown = {
-        "7kW": charger_data.get("by_power", {}).get("slow_ac", 0),
+        "7kW": by_power.get("slow_ac", 0),
         "22kW": 0,
-        "50kW": charger_data.get("by_power", {}).get("fast_dc", 0),
-        "150kW+": charger_data.get("by_power", {}).get("rapid_dc", 0)
+        "50kW": by_power.get("fast_dc", 0),
+        "150kW+": by_power.get("rapid_dc", 0)
     }
     
     competitive_gaps = analyze_competitive_gaps(power_breakdown, ev_density=0.03)
@@ -931,7 +979,9 @@ async def analyze_location_v2(request: ComplexLocationInput):
     duration_ms = (time.time() - start_time) * 1000
     _perf_monitor.record_call("analyze_location_v2", duration_ms)
     
-    return {
+    # Built from plain values, so it is encoded directly with orjson; a
+    # Response skips FastAPI's return-value validation and JSON encoder
+    return Response(orjson.dumps({
         "verdict": verdict,
         "overall_score": overall_score,
         "confidence": confidence_assessment["overall_confidence"],
@@ -957,9 +1007,9 @@ async def analyze_location_v2(request: ComplexLocationInput):
         "competition": {
             "score": competition_score,
             "nearby_chargers": charger_count,
-            "by_power_level": charger_data.get("by_power", {}),
+            "by_power_level": by_power,
             "closest_charger_km": min(
-                [c.get("distance_km", 999) for c in charger_data.get("chargers", [])],
+                (c.get("distance_km", 999) for c in charger_data.get("chargers", [])),
                 default=999
             )
         },
@@ -997,40 +1047,44 @@ async def analyze_location_v2(request: ComplexLocationInput):
             "cache_used": _cache.stats()["hits"] > 0,
             "request_format": "complex" if request.location else "simple"
         }
-    }
+    }), media_type="application/json")
 
 # ============================================================================
 # DAY 5: ADMIN & MONITORING ENDPOINTS
 # ============================================================================
 
+# Static payload, serialized once - "/" is hit by uptime checks
+_ROOT_BYTES = orjson.dumps({
+    "service": "EVL v10.1 + Day 1-5 Complete",
+    "version": "10.1+day1-5",
+    "status": "operational",
+    "features": [
+        "✅ Real-time data (8 sources)",
+        "✅ Day 1-5 fixes (C-7, C-4, C-6, C-3, M-3)",
+        "✅ V2.2 enhancements (gaps, confidence, opportunities)",
+        "✅ Production caching and monitoring",
+        "✅ Supports both simple and complex request formats"
+    ],
+    "endpoints": {
+        "analyze": "/api/v2/analyze-location",
+        "health": "/health/detailed",
+        "cache_stats": "/admin/cache-stats",
+        "performance": "/admin/performance"
+    }
+})
+
 @app.get("/")
 async def root():
-    return {
-        "service": "EVL v10.1 + Day 1-5 Complete",
-        "version": "10.1+day1-5",
-        "status": "operational",
-        "features": [
-            "✅ Real-time data (8 sources)",
-            "✅ Day 1-5 fixes (C-7, C-4, C-6, C-3, M-3)",
-            "✅ V2.2 enhancements (gaps, confidence, opportunities)",
-            "✅ Production caching and monitoring",
-            "✅ Supports both simple and complex request formats"
-        ],
-        "endpoints": {
-            "analyze": "/api/v2/analyze-location",
-            "health": "/health/detailed",
-            "cache_stats": "/admin/cache-stats",
-            "performance": "/admin/performance"
-        }
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 @app.get("/health")
 async def health():
-    return {
+    # Only the timestamp varies; orjson avoids FastAPI's generic encoder
+    return Response(orjson.dumps({
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
         "version": "10.1+day1-5"
-    }
+    }), media_type="application/json")
 
 @app.get("/health/detailed")
 async def detailed_health():
@@ -1067,8 +1121,9 @@ async def performance_stats():
 # STARTUP
 # ============================================================================
 
-@app.on_event("startup")
-async def startup_event():
+def startup_event():
+    # Pool is created before the first request, not lazily inside one
+    get_http_client()
     logger.info("=" * 60)
     logger.info("🚀 EVL v10.1 + Day 1-5 Complete Starting")
     logger.info("=" * 60)
@@ -1083,5 +1138,18 @@ async def startup_event():
     logger.info("=" * 60)
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Import string (not app) so uvicorn can spawn worker processes;
+    # uvloop has no Windows build, so fall back to the asyncio loop there.
+    # One worker by default: the response/geocode caches, single-flight maps
+    # and upstream rate limiting all live per process, so every extra worker
+    # multiplies upstream traffic
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1"))
+    )
@@ -0,0 +1,350 @@
+"""
+Upstream plumbing shared by main.py and the v2 router
+=====================================================
+
+One pooled HTTP client for every upstream call (Nominatim, OCM, Overpass),
+so both routers reuse the same keep-alive connections and TLS sessions.
+main.py's lifespan opens, warms and closes it.
+
+Geocoding lives here too, so both routers share one cache, one in-flight
+map and one Nominatim rate limit, as does OpenChargeMap POI parsing.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import numpy as np
+import orjson
+
+try:
+    import h2  # noqa: F401 - lets httpx speak HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:  # optional: pip install httpx[http2]
+    HTTP2_AVAILABLE = False
+
+try:
+    import diskcache
+except ImportError:  # optional: pip install diskcache
+    diskcache = None
+
+try:
+    from numba import njit
+except ImportError:  # optional: pip install numba
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# SHARED HTTP CLIENT
+# ============================================================================
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+# Connecting is quick when an upstream is healthy; fail fast (and retry a
+# new connection) instead of spending a whole read budget on it
+UPSTREAM_CONNECT_TIMEOUT = 5.0
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared AsyncClient, created on first use if startup hasn't run"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                retries=2  # connect errors only; a sent request is never replayed
+            ),
+            timeout=httpx.Timeout(20.0, connect=UPSTREAM_CONNECT_TIMEOUT)
+        )
+    return _http_client
+
+# Hosts on the analyze path, warmed at startup so the first request doesn't
+# pay DNS resolution and the TCP/TLS handshake
+UPSTREAM_WARMUP_URLS = (
+    "https://nominatim.openstreetmap.org/",
+    "https://api.openchargemap.io/",
+    "http://overpass-api.de/",
+)
+
+async def warm_http_client():
+    """Open pooled connections to each upstream; failures are ignored"""
+    client = get_http_client()
+    await asyncio.gather(
+        *(client.head(url, timeout=3.0) for url in UPSTREAM_WARMUP_URLS),
+        return_exceptions=True
+    )
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# ============================================================================
+# GEOCODING (cached - Nominatim allows ~1 req/s)
+# ============================================================================
+
+GEOCODE_TTL_SECONDS = 86400
+GEOCODE_NEGATIVE_TTL_SECONDS = 3600  # "not found" is cached, but briefly
+GEOCODE_CACHE_SIZE = 4096
+
+# normalized postcode -> ((lat, lon) or None, expires_at), least recently used first
+_geocode_cache: "OrderedDict[str, tuple[Optional[tuple[float, float]], float]]" = OrderedDict()
+
+# normalized postcode -> lookup in progress, so concurrent misses for the
+# same postcode make one Nominatim request
+_geocode_inflight: Dict[str, "asyncio.Task"] = {}
+
+# Nominatim's usage policy allows at most one request per second; uncached
+# lookups from concurrent analyses queue for a slot instead of getting the
+# client blocked. The slot is per process, so with WEB_CONCURRENCY uvicorn
+# workers each one waits that many seconds, keeping the total at ~1 req/s
+# (workers started any other way are not accounted for)
+NOMINATIM_MIN_INTERVAL_SECONDS = 1.0 * max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+_nominatim_lock = asyncio.Lock()
+_nominatim_next_slot = 0.0
+
+# Second tier on disk (when diskcache is installed) so geocodes survive
+# restarts and are shared by worker processes; Nominatim's usage policy asks
+# clients not to repeat identical queries
+GEOCODE_DISK_TTL_SECONDS = 30 * 86400
+_geocode_disk = (
+    diskcache.Cache(os.getenv("GEOCODE_CACHE_DIR", "/tmp/evl-geocode"), size_limit=128 << 20)
+    if diskcache else None
+)
+
+async def geocode_postcode(postcode: str) -> Optional[tuple]:
+    """
+    (lat, lon) for a postcode via Nominatim, or None if not found
+    
+    Results are kept for GEOCODE_TTL_SECONDS (misses for
+    GEOCODE_NEGATIVE_TTL_SECONDS). If Nominatim fails, an expired entry
+    for the same postcode is served rather than erroring.
+    """
+    key = " ".join(postcode.split()).lower()
+    entry = _geocode_cache.get(key)
+    if entry and time.time() < entry[1]:
+        _geocode_cache.move_to_end(key)
+        return entry[0]
+    
+    task = _geocode_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_lookup_postcode(key, postcode, entry))
+        _geocode_inflight[key] = task
+        task.add_done_callback(lambda _: _geocode_inflight.pop(key, None))
+    # Shielded: a cancelled caller must not cancel the joiners' lookup
+    return await asyncio.shield(task)
+
+
+async def _wait_for_nominatim_slot() -> None:
+    """Space Nominatim requests NOMINATIM_MIN_INTERVAL_SECONDS apart"""
+    global _nominatim_next_slot
+    async with _nominatim_lock:
+        delay = _nominatim_next_slot - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        _nominatim_next_slot = time.monotonic() + NOMINATIM_MIN_INTERVAL_SECONDS
+
+
+async def _lookup_postcode(key: str, postcode: str, entry: Optional[tuple]) -> Optional[tuple]:
+    """Cache miss path: disk tier, then Nominatim"""
+    if _geocode_disk is not None:
+        coords = await asyncio.to_thread(_geocode_disk.get, key)
+        if coords is not None:
+            _remember_geocode(key, coords)
+            return coords
+    
+    await _wait_for_nominatim_slot()
+    try:
+        response = await get_http_client().get(
+            "https://nominatim.openstreetmap.org/search",
+            params={"q": postcode, "format": "json", "limit": 1},
+            headers={"User-Agent": "EVL-V2/2.2"},
+            timeout=httpx.Timeout(10.0, connect=UPSTREAM_CONNECT_TIMEOUT)
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+    except Exception as e:
+        if entry:
+            logger.warning("Geocoding failed for %r, serving stale result: %s", postcode, e)
+            return entry[0]
+        raise
+    
+    if not data:
+        _remember_geocode(key, None, GEOCODE_NEGATIVE_TTL_SECONDS)
+        return None
+    
+    coords = (float(data[0]["lat"]), float(data[0]["lon"]))
+    _remember_geocode(key, coords)
+    if _geocode_disk is not None:
+        await asyncio.to_thread(_geocode_disk.set, key, coords, expire=GEOCODE_DISK_TTL_SECONDS)
+    return coords
+
+
+def _remember_geocode(key: str, coords: Optional[tuple], ttl_seconds: int = GEOCODE_TTL_SECONDS) -> None:
+    """Store coords in the in-memory LRU, evicting the oldest entries"""
+    _geocode_cache[key] = (coords, time.time() + ttl_seconds)
+    _geocode_cache.move_to_end(key)
+    while len(_geocode_cache) > GEOCODE_CACHE_SIZE:
+        _geocode_cache.popitem(last=False)
+
+# ============================================================================
+# DISTANCES
+# ============================================================================
+
+def _haversine_loop(lat0: float, lon0: float, lats: np.ndarray, lons: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """haversine_batch as an explicit loop, for numba to compile"""
+    phi0 = math.radians(lat0)
+    cos_phi0 = math.cos(phi0)
+    for i in range(lats.shape[0]):
+        phi = math.radians(lats[i])
+        s_dlat = math.sin((phi - phi0) / 2)
+        s_dlon = math.sin(math.radians(lons[i] - lon0) / 2)
+        a = s_dlat * s_dlat + cos_phi0 * math.cos(phi) * s_dlon * s_dlon
+        out[i] = 2 * 6371.0 * math.asin(math.sqrt(min(a, 1.0)))
+    return out
+
+# Compiled, the loop makes a single pass with no temporary arrays (the NumPy
+# version allocates one per ufunc step). njit compiles on the first call;
+# warm_haversine_kernel() makes that call at startup
+_haversine_kernel = njit(cache=True, fastmath=True)(_haversine_loop) if njit is not None else None
+
+def warm_haversine_kernel():
+    """Compile the numba kernel now so the first request doesn't block on it"""
+    if _haversine_kernel is not None:
+        haversine_batch(0.0, 0.0, np.zeros(2), np.zeros(2))
+
+def haversine_batch(lat0: float, lon0: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Distances in km from one point to many (unrounded), one array pass"""
+    if _haversine_kernel is not None:
+        return _haversine_kernel(lat0, lon0, lats, lons, np.empty(lats.shape[0], dtype=np.float64))
+    
+    R = 6371.0
+    # Origin terms are scalars: compute them once with math, not as ufuncs
+    phi0 = math.radians(lat0)
+    cos_phi0 = math.cos(phi0)
+    phi = np.radians(lats)
+    dlat = phi - phi0
+    dlon = np.radians(lons - lon0)
+    a = np.sin(dlat / 2) ** 2 + cos_phi0 * np.cos(phi) * np.sin(dlon / 2) ** 2
+    # asin form: one sqrt and no atan2 per point (a stays within [0, 1])
+    return 2 * R * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+# ============================================================================
+# OPENCHARGEMAP POIs
+# ============================================================================
+
+# Resolved once at import; the env does not change while the process runs
+OPENCHARGEMAP_API_KEY = os.getenv("OPENCHARGEMAP_API_KEY", "")
+
+# M-3: Power validation
+DEFAULT_POWER_KW = 7.0      # Standard AC charger power
+MIN_VALID_POWER_KW = 1.0    # Minimum valid power
+MAX_VALID_POWER_KW = 500.0  # Maximum valid power (ultra-rapid)
+
+def parse_ocm_pois(
+    data: List[Dict[str, Any]],
+    lat: float,
+    lon: float,
+    validate_power: Callable[[Any, str], tuple]
+) -> Dict[str, Any]:
+    """
+    OpenChargeMap POIs as parallel columns (struct-of-arrays)
+    
+    One pass pulls each POI's fields into lists, skipping and logging
+    malformed POIs (C-7); power validation (M-3), power levels and distances
+    from (lat, lon) then run per column. validate_power(raw, charger_id) is
+    called for each invalid power so the caller logs the reason its own way.
+    """
+    ids = []
+    charger_ids = []
+    names = []
+    lats = []
+    lons = []
+    raw_powers = []
+    statuses = []
+    operators = []
+    num_points = []
+    parse_errors = []
+    
+    for poi in data:
+        try:
+            address_info = poi.get("AddressInfo", {})
+            connections = poi.get("Connections", [])
+            
+            raw_power = 0
+            if connections:
+                raw_power = connections[0].get("PowerKW", 0) or 0
+            
+            status = poi.get("StatusType", {}).get("Title", "Unknown")
+            operator = poi.get("OperatorInfo", {}).get("Title", "Unknown")
+            poi_lat = address_info.get("Latitude")
+            poi_lon = address_info.get("Longitude")
+            name = address_info.get("Title", "Unknown")
+            if poi_lat and poi_lon:
+                # Validates the coordinates here so a bad POI fails alone
+                float(poi_lat), float(poi_lon)
+        except Exception as e:
+            # C-7: LOG PARSING ERRORS
+            poi_id = poi.get("ID", "unknown")
+            logger.error("Failed to parse POI %s: %s", poi_id, e)
+            parse_errors.append({"poi_id": poi_id, "error": str(e)})
+            continue
+        
+        ids.append(poi.get("ID"))
+        charger_ids.append(str(poi.get("ID", "unknown")))
+        names.append(name)
+        lats.append(poi_lat)
+        lons.append(poi_lon)
+        raw_powers.append(raw_power)
+        statuses.append(status)
+        operators.append(operator)
+        num_points.append(poi.get("NumberOfPoints", 1))
+    
+    # M-3: VALIDATE POWER - whole column at once; non-numeric becomes NaN
+    # and fails both bounds
+    raw = np.array(
+        [p if isinstance(p, (int, float)) else np.nan for p in raw_powers],
+        dtype=np.float64
+    )
+    valid = (raw >= MIN_VALID_POWER_KW) & (raw <= MAX_VALID_POWER_KW)
+    powers = np.where(valid, raw, np.where(raw > MAX_VALID_POWER_KW, MAX_VALID_POWER_KW, DEFAULT_POWER_KW))
+    for i in np.flatnonzero(~valid).tolist():
+        validate_power(raw_powers[i], charger_ids[i])
+    
+    rapid_dc = int(np.count_nonzero(powers >= 150))  # 150+ kW
+    fast_dc = int(np.count_nonzero(powers >= 50)) - rapid_dc  # 50+ kW
+    slow_ac = len(powers) - rapid_dc - fast_dc  # < 50 kW
+    
+    # Distances for all located chargers in one vectorized call
+    distances: List[Optional[float]] = [None] * len(ids)
+    located = [i for i, (poi_lat, poi_lon) in enumerate(zip(lats, lons)) if poi_lat and poi_lon]
+    if located:
+        lat_arr = np.fromiter((float(lats[i]) for i in located), dtype=np.float64, count=len(located))
+        lon_arr = np.fromiter((float(lons[i]) for i in located), dtype=np.float64, count=len(located))
+        dists = np.round(haversine_batch(lat, lon, lat_arr, lon_arr), 2)
+        for i, dist in zip(located, dists.tolist()):
+            distances[i] = dist
+    
+    return {
+        "ids": ids,
+        "charger_ids": charger_ids,
+        "names": names,
+        "lats": lats,
+        "lons": lons,
+        "raw_powers": raw_powers,
+        "powers": powers,
+        "valid": valid,
+        "statuses": statuses,
+        "operators": operators,
+        "num_points": num_points,
+        "distances": distances,  # km, None where the POI has no location
+        "parse_errors": parse_errors,
+        "by_power": {"slow_ac": slow_ac, "fast_dc": fast_dc, "rapid_dc": rapid_dc},
+    }
@@ -8,8 +8,8 @@ V2 API - Business-Focused with REAL DATA + C-3 + M-3 Validation
 Uses all Day 1 fixes: C-7 (logging), C-4 (validation), C-6 (AADT validation)
 """
 
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import logging
@@ -23,7 +23,21 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 # We'll use async imports to avoid circular dependencies
 import httpx
-import math
+import orjson
+import numpy as np
+
+# Pooled client (owned by main.py's lifespan), the one geocode cache and
+# the OpenChargeMap POI parsing shared with main.py
+from upstream import (
+    DEFAULT_POWER_KW,
+    MAX_VALID_POWER_KW,
+    MIN_VALID_POWER_KW,
+    OPENCHARGEMAP_API_KEY,
+    UPSTREAM_CONNECT_TIMEOUT,
+    geocode_postcode,
+    get_http_client,
+    parse_ocm_pois,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,19 +56,13 @@ MAX_LATITUDE = 90.0
 MIN_LONGITUDE = -180.0
 MAX_LONGITUDE = 180.0
 
-# ============================================================================
-# [M-3] Power Validation Constants
-# ============================================================================
-
-DEFAULT_POWER_KW = 7.0      # Standard AC charger power
-MIN_VALID_POWER_KW = 1.0    # Minimum valid power
-MAX_VALID_POWER_KW = 500.0  # Maximum valid power (ultra-rapid)
-
 # ============================================================================
 # Response Models
 # ============================================================================
 
 class LocationInput(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+    
     postcode: Optional[str] = None
     lat: Optional[float] = None
     lon: Optional[float] = None
@@ -77,18 +85,6 @@ class V2AnalysisResponse(BaseModel):
 # Utility Functions (copied from main.py)
 # ============================================================================
 
-def distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance in km using Haversine formula"""
-    R = 6371
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = (math.sin(dlat/2)**2 + 
-         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * 
-         math.sin(dlon/2)**2)
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    return round(R * c, 2)
-
-
 def validate_coordinates(lat: float, lon: float, context: str = "unknown") -> tuple:
     """
     Validate latitude and longitude values.
@@ -97,29 +93,29 @@ def validate_coordinates(lat: float, lon: float, context: str = "unknown") -> tu
     # Validate latitude
     if not isinstance(lat, (int, float)):
         error = f"Latitude must be numeric, got {type(lat).__name__}"
-        logger.warning(f"Invalid latitude in {context}: {error}")
+        logger.warning("Invalid latitude in %s: %s", context, error)
         return False, error
     
     if lat < MIN_LATITUDE or lat > MAX_LATITUDE:
         error = f"Latitude must be between {MIN_LATITUDE} and {MAX_LATITUDE}, got {lat}"
-        logger.warning(f"Latitude out of range in {context}: {error}")
+        logger.warning("Latitude out of range in %s: %s", context, error)
         return False, error
     
     # Validate longitude
     if not isinstance(lon, (int, float)):
         error = f"Longitude must be numeric, got {type(lon).__name__}"
-        logger.warning(f"Invalid longitude in {context}: {error}")
+        logger.warning("Invalid longitude in %s: %s", context, error)
         return False, error
     
     if lon < MIN_LONGITUDE or lon > MAX_LONGITUDE:
         error = f"Longitude must be between {MIN_LONGITUDE} and {MAX_LONGITUDE}, got {lon}"
-        logger.warning(f"Longitude out of range in {context}: {error}")
+        logger.warning("Longitude out of range in %s: %s", context, error)
         return False, error
     
     # Check for Null Island (common geocoding failure)
     if round(lat, 6) == 0.0 and round(lon, 6) == 0.0:
         error = "Invalid coordinates (0, 0) - likely geocoding failure"
-        logger.warning(f"Null Island coordinates in {context}")
+        logger.warning("Null Island coordinates in %s", context)
         return False, error
     
     return True, None
@@ -132,17 +128,17 @@ def validate_radius(radius_km: float, context: str = "unknown") -> tuple:
     """
     if not isinstance(radius_km, (int, float)):
         error = f"Radius must be numeric, got {type(radius_km).__name__}"
-        logger.warning(f"Invalid radius in {context}: {error}")
+        logger.warning("Invalid radius in %s: %s", context, error)
         return False, error
     
     if radius_km <= 0:
         error = f"Radius must be positive, got {radius_km}"
-        logger.warning(f"Invalid radius in {context}: {error}")
+        logger.warning("Invalid radius in %s: %s", context, error)
         return False, error
     
     if radius_km > 100:
         error = f"Radius too large (max 100km), got {radius_km}"
-        logger.warning(f"Radius in {context}: {error}")
+        logger.warning("Radius in %s: %s", context, error)
         return False, error
     
     return True, None
@@ -165,34 +161,35 @@ def validate_power_kw(power_kw: Any, charger_id: str = "unknown") -> tuple:
     # Check if numeric
     if not isinstance(power_kw, (int, float)):
         logger.warning(
-            f"Power validation failed for charger {charger_id}: "
-            f"Non-numeric value '{power_kw}' (type: {type(power_kw).__name__}), "
-            f"using default {DEFAULT_POWER_KW}kW"
+            "Power validation failed for charger %s: "
+            "Non-numeric value '%s' (type: %s), using default %skW",
+            charger_id, power_kw, type(power_kw).__name__, DEFAULT_POWER_KW
         )
         return DEFAULT_POWER_KW, False
     
     # Check if positive
     if power_kw <= 0:
         logger.warning(
-            f"Power validation failed for charger {charger_id}: "
-            f"Non-positive value {power_kw}kW, using default {DEFAULT_POWER_KW}kW"
+            "Power validation failed for charger %s: "
+            "Non-positive value %skW, using default %skW",
+            charger_id, power_kw, DEFAULT_POWER_KW
         )
         return DEFAULT_POWER_KW, False
     
     # Check if within plausible range
     if power_kw < MIN_VALID_POWER_KW:
         logger.warning(
-            f"Power validation warning for charger {charger_id}: "
-            f"Unusually low value {power_kw}kW (< {MIN_VALID_POWER_KW}kW), "
-            f"using default {DEFAULT_POWER_KW}kW"
+            "Power validation warning for charger %s: "
+            "Unusually low value %skW (< %skW), using default %skW",
+            charger_id, power_kw, MIN_VALID_POWER_KW, DEFAULT_POWER_KW
         )
         return DEFAULT_POWER_KW, False
     
     if power_kw > MAX_VALID_POWER_KW:
         logger.warning(
-            f"Power validation warning for charger {charger_id}: "
-            f"Unusually high value {power_kw}kW (> {MAX_VALID_POWER_KW}kW), "
-            f"capping at {MAX_VALID_POWER_KW}kW"
+            "Power validation warning for charger %s: "
+            "Unusually high value %skW (> %skW), capping at %skW",
+            charger_id, power_kw, MAX_VALID_POWER_KW, MAX_VALID_POWER_KW
         )
         return MAX_VALID_POWER_KW, False
     
@@ -208,26 +205,24 @@ async def fetch_real_chargers(lat: float, lon: float, radius_km: float = 5.0) ->
     Fetch real charger data from OpenChargeMap.
     [C-7] Includes error logging and quality tracking.
     """
-    api_key = os.getenv("OPENCHARGEMAP_API_KEY", "")
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.openchargemap.io/v3/poi/",
-                params={
-                    "output": "json",
-                    "latitude": lat,
-                    "longitude": lon,
-                    "distance": radius_km,
-                    "distanceunit": "km",
-                    "maxresults": 100,
-                    "compact": "false",
-                    "key": api_key
-                },
-                timeout=15.0
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.get(
+            "https://api.openchargemap.io/v3/poi/",
+            params={
+                "output": "json",
+                "latitude": lat,
+                "longitude": lon,
+                "distance": radius_km,
+                "distanceunit": "km",
+                "maxresults": 100,
+                "compact": "false",
+                "key": OPENCHARGEMAP_API_KEY
+            },
+            timeout=httpx.Timeout(15.0, connect=UPSTREAM_CONNECT_TIMEOUT)
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
         if not data:
             return {
@@ -237,100 +232,66 @@ async def fetch_real_chargers(lat: float, lon: float, radius_km: float = 5.0) ->
                 "by_power": {"fast_dc": 0, "rapid_dc": 0, "slow_ac": 0}
             }
         
-        # Parse chargers with error tracking (C-7) and power validation (M-3)
-        chargers = []
-        parse_errors = []
-        power_valid_count = 0
-        power_invalid_count = 0
-        power_validation_details = []
+        # [C-7] parse errors and [M-3] power validation, one column at a time
+        cols = parse_ocm_pois(data, lat, lon, validate_power_kw)
+        parse_errors = cols["parse_errors"]
+        charger_ids = cols["charger_ids"]
+        raw_powers = cols["raw_powers"]
+        powers = cols["powers"]
+        valid = cols["valid"]
         
-        # Count by power level
-        fast_dc = 0  # 50+ kW
-        rapid_dc = 0  # 150+ kW
-        slow_ac = 0  # < 50 kW
+        invalid_idx = np.flatnonzero(~valid).tolist()
+        power_valid_count = len(raw_powers) - len(invalid_idx)
+        power_invalid_count = len(invalid_idx)
+        power_validation_details = [
+            {
+                "charger_id": charger_ids[i],
+                "charger_name": cols["names"][i],
+                "raw_power": raw_powers[i],
+                "validated_power": float(powers[i])
+            }
+            for i in invalid_idx[:5]
+        ]
         
-        for poi in data:
-            try:
-                address_info = poi.get("AddressInfo", {})
-                connections = poi.get("Connections", [])
-                charger_id = str(poi.get("ID", "unknown"))
-                
-                # Get raw power (default to 0 if not available)
-                raw_power = 0
-                if connections and len(connections) > 0:
-                    raw_power = connections[0].get("PowerKW", 0) or 0
-                
-                # [M-3] VALIDATE POWER
-                validated_power, is_valid = validate_power_kw(raw_power, charger_id)
-                
-                if is_valid:
-                    power_valid_count += 1
-                else:
-                    power_invalid_count += 1
-                    power_validation_details.append({
-                        "charger_id": charger_id,
-                        "charger_name": address_info.get("Title", "Unknown"),
-                        "raw_power": raw_power,
-                        "validated_power": validated_power
-                    })
-                
-                # Categorize by power
-                if validated_power >= 150:
-                    rapid_dc += 1
-                elif validated_power >= 50:
-                    fast_dc += 1
-                else:
-                    slow_ac += 1
-                
-                charger_data = {
-                    "id": poi.get("ID"),
-                    "name": address_info.get("Title", "Unknown"),
-                    "lat": address_info.get("Latitude"),
-                    "lon": address_info.get("Longitude"),
-                    "power_kw": validated_power,
-                    "power_validated": is_valid,
-                    "power_original": raw_power if is_valid else None,
-                    "status": poi.get("StatusType", {}).get("Title", "Unknown"),
-                    "operator": poi.get("OperatorInfo", {}).get("Title", "Unknown"),
-                    "num_points": poi.get("NumberOfPoints", 1),
-                }
-                
-                # Calculate distance
-                if charger_data["lat"] and charger_data["lon"]:
-                    charger_data["distance_km"] = distance(
-                        lat, lon,
-                        charger_data["lat"], charger_data["lon"]
-                    )
-                
-                chargers.append(charger_data)
-                
-            except Exception as e:
-                poi_id = poi.get("ID", "unknown")
-                logger.error(f"Failed to parse charger POI {poi_id}: {e}")
-                parse_errors.append({"poi_id": poi_id, "error": str(e)})
-                continue
+        chargers = [
+            {
+                "id": charger_id,
+                "name": name,
+                "lat": poi_lat,
+                "lon": poi_lon,
+                "power_kw": power,
+                "power_validated": is_valid,
+                "power_original": raw_power if is_valid else None,
+                "status": status,
+                "operator": operator,
+                "num_points": points,
+            }
+            for charger_id, name, poi_lat, poi_lon, power, is_valid, raw_power, status, operator, points
+            in zip(cols["ids"], cols["names"], cols["lats"], cols["lons"], powers.tolist(), valid.tolist(),
+                   raw_powers, cols["statuses"], cols["operators"], cols["num_points"])
+        ]
+        for charger, dist in zip(chargers, cols["distances"]):
+            if dist is not None:
+                charger["distance_km"] = dist
         
         # Log parse summary (C-7)
-        logger.info(f"Parsed {len(chargers)}/{len(data)} chargers successfully")
+        logger.debug("Parsed %d/%d chargers successfully", len(chargers), len(data))
         if parse_errors:
-            logger.warning(f"{len(parse_errors)} chargers failed to parse")
+            logger.warning("%d chargers failed to parse", len(parse_errors))
         
         # [M-3] Log power validation summary
         if power_invalid_count > 0:
             logger.warning(
-                f"Power validation: {power_valid_count}/{len(chargers)} valid "
-                f"({power_valid_count/len(chargers):.1%}), {power_invalid_count} invalid"
+                "Power validation: %d/%d valid (%.1f%%), %d invalid",
+                power_valid_count, len(chargers),
+                power_valid_count / len(chargers) * 100, power_invalid_count
             )
         
         return {
             "success": True,
             "chargers": chargers,
             "count": len(chargers),
-            "by_power": {
-                "fast_dc": fast_dc,
-                "rapid_dc": rapid_dc,
-                "slow_ac": slow_ac
-            },
+            "by_power": cols["by_power"],
             "parse_summary": {
                 "total": len(data),
                 "parsed": len(chargers),
@@ -342,12 +303,12 @@ async def fetch_real_chargers(lat: float, lon: float, radius_km: float = 5.0) ->
                 "invalid_power": power_invalid_count,
                 "validation_rate": power_valid_count / len(chargers) if chargers else 1.0,
                 "default_used": power_invalid_count > 0,
-                "validation_details": power_validation_details[:5]
+                "validation_details": power_validation_details
             }
         }
         
     except Exception as e:
-        logger.error(f"Failed to fetch chargers: {e}")
+        logger.error("Failed to fetch chargers: %s", e)
         return {
             "success": False,
             "chargers": [],
@@ -368,13 +329,13 @@ async def fetch_real_traffic(lat: float, lon: float, radius_km: float = 2.0) ->
     def validate_aadt(aadt: Any, road_id: str = "unknown") -> tuple:
         """Validate AADT value (C-6)"""
         if not isinstance(aadt, (int, float)):
-            logger.warning(f"Invalid AADT type for {road_id}, using default")
+            logger.warning("Invalid AADT type for %s, using default", road_id)
             return DEFAULT_AADT, False
         if aadt <= 0:
-            logger.warning(f"Non-positive AADT for {road_id}, using default")
+            logger.warning("Non-positive AADT for %s, using default", road_id)
             return DEFAULT_AADT, False
         if aadt < MIN_VALID_AADT or aadt > MAX_VALID_AADT:
-            logger.warning(f"AADT out of range for {road_id}, using default")
+            logger.warning("AADT out of range for %s, using default", road_id)
             return DEFAULT_AADT, False
         return int(aadt), True
     
@@ -388,19 +349,17 @@ async def fetch_real_traffic(lat: float, lon: float, radius_km: float = 2.0) ->
           way["highway"~"motorway|trunk|primary|secondary"]
             (around:{radius_m},{lat},{lon});
         );
-        out body;
-        >;
-        out skel qt;
+        out tags;
         """
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                overpass_url,
-                data={"data": query},
-                timeout=30
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.post(
+            overpass_url,
+            data={"data": query},
+            timeout=httpx.Timeout(30.0, connect=UPSTREAM_CONNECT_TIMEOUT)
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
         if not data.get("elements"):
             return {
@@ -444,7 +403,7 @@ async def fetch_real_traffic(lat: float, lon: float, radius_km: float = 2.0) ->
         }
         
     except Exception as e:
-        logger.error(f"Failed to fetch traffic data: {e}")
+        logger.error("Failed to fetch traffic data: %s", e)
         return {
             "success": False,
             "avg_aadt": DEFAULT_AADT,
@@ -554,7 +513,13 @@ def identify_risks(overall_score: int, charger_count: int, confidence: float) ->
 # Main Analysis Endpoint
 # ============================================================================
 
-@router_v2.post("/analyze-location", response_model=V2AnalysisResponse)
+# The handler returns pre-encoded JSON, so no response_model is applied;
+# V2AnalysisResponse is attached to the 200 response for the OpenAPI schema only
+@router_v2.post(
+    "/analyze-location",
+    response_model=None,
+    responses={200: {"model": V2AnalysisResponse, "description": "V2 analysis"}}
+)
 async def analyze_location_v2(location: LocationInput):
     """
     Analyze location for EV charging station - Business-focused V2 API
@@ -572,31 +537,23 @@ async def analyze_location_v2(location: LocationInput):
     # Geocode if needed
     if postcode and not (lat and lon):
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://nominatim.openstreetmap.org/search",
-                    params={"q": postcode, "format": "json", "limit": 1},
-                    headers={"User-Agent": "EVL-V2/2.0"},
-                    timeout=10.0
-                )
-                data = response.json()
-                if data:
-                    lat = float(data[0]["lat"])
-                    lon = float(data[0]["lon"])
-                    
-                    # [C-3] VALIDATE GEOCODED COORDINATES
-                    is_valid, error = validate_coordinates(lat, lon, "V2 geocoding result")
-                    if not is_valid:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Geocoding returned invalid coordinates: {error}"
-                        )
-                else:
-                    raise HTTPException(status_code=404, detail="Location not found")
+            coords = await geocode_postcode(postcode)
+            if coords:
+                lat, lon = coords
+                
+                # [C-3] VALIDATE GEOCODED COORDINATES
+                is_valid, error = validate_coordinates(lat, lon, "V2 geocoding result")
+                if not is_valid:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Geocoding returned invalid coordinates: {error}"
+                    )
+            else:
+                raise HTTPException(status_code=404, detail="Location not found")
         except HTTPException:
             raise  # Re-raise HTTPException as-is
         except Exception as e:
-            logger.error(f"Geocoding failed: {e}")
+            logger.error("Geocoding failed: %s", e)
             raise HTTPException(status_code=500, detail="Geocoding failed")
     
     if not (lat and lon):
@@ -615,7 +572,7 @@ async def analyze_location_v2(location: LocationInput):
     if not is_valid:
         raise HTTPException(status_code=400, detail=error)
     
-    logger.info(f"V2 Analysis: lat={lat}, lon={lon}, radius={radius_km}km")
+    logger.debug("V2 Analysis: lat=%s, lon=%s, radius=%skm", lat, lon, radius_km)
     
     # ========================================================================
     # FETCH REAL DATA (C-1: No more mock data!)
@@ -681,7 +638,10 @@ async def analyze_location_v2(location: LocationInput):
     # BUILD RESPONSE
     # ========================================================================
     
-    return {
+    # Every field below is built here from already-validated values, so it
+    # is serialized straight to JSON with orjson (V2AnalysisResponse only
+    # documents the shape; see the route decorator)
+    response = {
         "verdict": verdict,
         "overall_score": overall_score,
         "confidence": round(confidence, 2),
@@ -711,7 +671,7 @@ async def analyze_location_v2(location: LocationInput):
             "nearby_chargers": charger_count,
             "by_power_level": charger_data.get("by_power", {}),
             "closest_charger_km": min(
-                [c.get("distance_km", 999) for c in charger_data.get("chargers", [])],
+                (c.get("distance_km", 999) for c in charger_data.get("chargers", [])),
                 default=999
             )
         },
@@ -749,6 +709,8 @@ async def analyze_location_v2(location: LocationInput):
             "mock_data": False  # ✅ NO MORE MOCK DATA!
         }
     }
+    
+    return Response(orjson.dumps(response), media_type="application/json")
 
 # ============================================================================
 # Additional Endpoints
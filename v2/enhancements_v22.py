@@ -15,6 +15,7 @@ Date: November 2025
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from enum import Enum
+import re
 
 
 class PowerLevel(str, Enum):
@@ -200,8 +201,10 @@ class CompetitiveGapAnalyzer:
         
         gaps = []
         blue_ocean_opportunities = []
+        total_gap = 0
+        opportunity_total = 0.0
         
-        # Analyze each power level
+        # Analyze each power level (summary totals accumulate in the same pass)
         for power_level in ["7kW", "22kW", "50kW", "150kW+"]:
             current = power_breakdown.get(power_level, 0)
             market_avg = averages[power_level]
@@ -238,7 +241,11 @@ class CompetitiveGapAnalyzer:
                 is_blue_ocean=is_blue_ocean
             )
             
-            gaps.append(gap.to_dict())
+            gap_dict = gap.to_dict()
+            gaps.append(gap_dict)
+            if gap_size > 0:
+                total_gap += gap_size
+            opportunity_total += gap_dict["opportunity_score"]
             
             if is_blue_ocean:
                 blue_ocean_opportunities.append({
@@ -250,8 +257,7 @@ class CompetitiveGapAnalyzer:
                 })
         
         # Generate summary
-        total_gap = sum(g["gap_size"] for g in gaps if g["gap_size"] > 0)
-        avg_opportunity = sum(g["opportunity_score"] for g in gaps) / len(gaps) if gaps else 0
+        avg_opportunity = opportunity_total / len(gaps) if gaps else 0
         
         return {
             "power_breakdown": power_breakdown,
@@ -506,6 +512,13 @@ class ConfidenceAssessor:
         return strengths
 
 
+# Opportunity type keywords, checked in this order (case-insensitive, so
+# the text is never lowercased)
+_BLUE_OCEAN_RE = re.compile(r"blue ocean|underserved", re.IGNORECASE)
+_DEMAND_RE = re.compile(r"demand|high traffic", re.IGNORECASE)
+_UPGRADE_RE = re.compile(r"upgrade|modernize", re.IGNORECASE)
+
+
 class OpportunityEnhancer:
     """Enhances basic opportunities with risk, ROI, and actionability details"""
     
@@ -532,17 +545,15 @@ class OpportunityEnhancer:
         
         for opp_text in basic_opportunities:
             # Parse opportunity type
-            opp_lower = opp_text.lower()
-            
-            if "blue ocean" in opp_lower or "underserved" in opp_lower:
+            if _BLUE_OCEAN_RE.search(opp_text):
                 enhanced.append(self._create_blue_ocean_opportunity(
                     opp_text, scores, competitive_data, financial_data
                 ))
-            elif "demand" in opp_lower or "high traffic" in opp_lower:
+            elif _DEMAND_RE.search(opp_text):
                 enhanced.append(self._create_demand_opportunity(
                     opp_text, scores, competitive_data, financial_data
                 ))
-            elif "upgrade" in opp_lower or "modernize" in opp_lower:
+            elif _UPGRADE_RE.search(opp_text):
                 enhanced.append(self._create_upgrade_opportunity(
                     opp_text, scores, competitive_data, financial_data
                 ))
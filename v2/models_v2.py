@@ -14,7 +14,7 @@ Instructions:
 
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
 
 
@@ -30,16 +30,15 @@ class CompetitivePowerBreakdown(BaseModel):
     power_150kw: int = Field(..., description="Number of 150kW+ chargers")
     total_chargers: int = Field(..., description="Total chargers in area")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "power_7kw": 12,
-                "power_22kw": 8,
-                "power_50kw": 3,
-                "power_150kw": 1,
-                "total_chargers": 24
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "power_7kw": 12,
+            "power_22kw": 8,
+            "power_50kw": 3,
+            "power_150kw": 1,
+            "total_chargers": 24
         }
+    })
 
 
 class PowerLevelGap(BaseModel):
@@ -53,19 +52,18 @@ class PowerLevelGap(BaseModel):
     reasoning: str = Field(..., description="Explanation of the gap")
     is_blue_ocean: bool = Field(..., description="Whether this is a Blue Ocean opportunity")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "power_level": "150kW+",
-                "current_count": 0,
-                "market_average": 3,
-                "gap_size": 3,
-                "gap_percentage": 100.0,
-                "opportunity_score": 8.5,
-                "reasoning": "Gap of 3 chargers at 150kW+ vs market average. High demand potential with 12.5% EV adoption.",
-                "is_blue_ocean": True
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "power_level": "150kW+",
+            "current_count": 0,
+            "market_average": 3,
+            "gap_size": 3,
+            "gap_percentage": 100.0,
+            "opportunity_score": 8.5,
+            "reasoning": "Gap of 3 chargers at 150kW+ vs market average. High demand potential with 12.5% EV adoption.",
+            "is_blue_ocean": True
         }
+    })
 
 
 class BlueOceanOpportunity(BaseModel):
@@ -74,14 +72,13 @@ class BlueOceanOpportunity(BaseModel):
     opportunity_score: float = Field(..., description="Opportunity score (0-10)")
     description: str = Field(..., description="Detailed description of opportunity")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "power_level": "150kW+",
-                "opportunity_score": 8.5,
-                "description": "Blue Ocean: 150kW+ chargers are severely underserved. Only 0 vs market average of 3. First-mover advantage available."
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "power_level": "150kW+",
+            "opportunity_score": 8.5,
+            "description": "Blue Ocean: 150kW+ chargers are severely underserved. Only 0 vs market average of 3. First-mover advantage available."
         }
+    })
 
 
 class CompetitiveGapSummary(BaseModel):
@@ -91,15 +88,14 @@ class CompetitiveGapSummary(BaseModel):
     blue_ocean_count: int = Field(..., description="Number of Blue Ocean opportunities")
     location_type: str = Field(..., description="Location type analyzed")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "total_gap_chargers": 8,
-                "average_opportunity_score": 6.3,
-                "blue_ocean_count": 2,
-                "location_type": "urban_medium_density"
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "total_gap_chargers": 8,
+            "average_opportunity_score": 6.3,
+            "blue_ocean_count": 2,
+            "location_type": "urban_medium_density"
         }
+    })
 
 
 class CompetitiveGapAnalysisResponse(BaseModel):
@@ -109,25 +105,24 @@ class CompetitiveGapAnalysisResponse(BaseModel):
     blue_ocean_opportunities: List[BlueOceanOpportunity] = Field(..., description="Blue Ocean opportunities")
     summary: CompetitiveGapSummary = Field(..., description="Analysis summary")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "power_breakdown": {
-                    "7kW": 5,
-                    "22kW": 3,
-                    "50kW": 1,
-                    "150kW+": 0
-                },
-                "gaps": [],
-                "blue_ocean_opportunities": [],
-                "summary": {
-                    "total_gap_chargers": 8,
-                    "average_opportunity_score": 6.3,
-                    "blue_ocean_count": 2,
-                    "location_type": "urban_medium_density"
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "power_breakdown": {
+                "7kW": 5,
+                "22kW": 3,
+                "50kW": 1,
+                "150kW+": 0
+            },
+            "gaps": [],
+            "blue_ocean_opportunities": [],
+            "summary": {
+                "total_gap_chargers": 8,
+                "average_opportunity_score": 6.3,
+                "blue_ocean_count": 2,
+                "location_type": "urban_medium_density"
             }
         }
+    })
 
 
 # ============================================================================
@@ -145,25 +140,24 @@ class ConfidenceAssessmentResponse(BaseModel):
     caveats: List[str] = Field(..., description="Important caveats and limitations")
     strengths: List[str] = Field(..., description="Analysis strengths")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "overall_confidence": 0.78,
-                "data_quality_score": 0.85,
-                "sample_size_score": 0.70,
-                "source_reliability_score": 0.90,
-                "consistency_score": 0.75,
-                "reasoning": "High confidence in recommendations. Based on strong data quality, highly reliable sources.",
-                "caveats": [
-                    "Sample sizes for traffic data are limited",
-                    "Seasonal variations not fully captured"
-                ],
-                "strengths": [
-                    "Data from highly reliable government and industry sources",
-                    "Internally consistent analysis across all metrics"
-                ]
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "overall_confidence": 0.78,
+            "data_quality_score": 0.85,
+            "sample_size_score": 0.70,
+            "source_reliability_score": 0.90,
+            "consistency_score": 0.75,
+            "reasoning": "High confidence in recommendations. Based on strong data quality, highly reliable sources.",
+            "caveats": [
+                "Sample sizes for traffic data are limited",
+                "Seasonal variations not fully captured"
+            ],
+            "strengths": [
+                "Data from highly reliable government and industry sources",
+                "Internally consistent analysis across all metrics"
+            ]
         }
+    })
 
 
 # ============================================================================
@@ -185,35 +179,34 @@ class EnhancedOpportunityResponse(BaseModel):
     success_metrics: List[str] = Field(..., description="Success measurement criteria")
     next_steps: List[str] = Field(..., description="Recommended next steps")
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "title": "Blue Ocean Market Entry",
-                "description": "Blue Ocean: 150kW+ chargers are severely underserved in this area.",
-                "priority": "high",
-                "impact_score": 9.0,
-                "effort_score": 7.0,
-                "roi_multiplier": 2.5,
-                "timeframe": "12-18 months",
-                "risk_level": "medium",
-                "risk_factors": [
-                    "First-mover risk - market may be unproven",
-                    "Higher initial marketing costs"
-                ],
-                "mitigation_strategies": [
-                    "Start with pilot phase (2-4 chargers)",
-                    "Secure long-term site agreements"
-                ],
-                "success_metrics": [
-                    "Market share >30% within 12 months",
-                    "Utilization rate >40% within 6 months"
-                ],
-                "next_steps": [
-                    "Conduct detailed site survey",
-                    "Secure grid connection approval"
-                ]
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "title": "Blue Ocean Market Entry",
+            "description": "Blue Ocean: 150kW+ chargers are severely underserved in this area.",
+            "priority": "high",
+            "impact_score": 9.0,
+            "effort_score": 7.0,
+            "roi_multiplier": 2.5,
+            "timeframe": "12-18 months",
+            "risk_level": "medium",
+            "risk_factors": [
+                "First-mover risk - market may be unproven",
+                "Higher initial marketing costs"
+            ],
+            "mitigation_strategies": [
+                "Start with pilot phase (2-4 chargers)",
+                "Secure long-term site agreements"
+            ],
+            "success_metrics": [
+                "Market share >30% within 12 months",
+                "Utilization rate >40% within 6 months"
+            ],
+            "next_steps": [
+                "Conduct detailed site survey",
+                "Secure grid connection approval"
+            ]
         }
+    })
 
 
 # ============================================================================